@@ -0,0 +1,23 @@
+from pydbm.benchmarks.suite import (
+    FIELD_TYPES,
+    OPERATIONS,
+    Result,
+    create_model,
+    format_json,
+    format_table,
+    percentile,
+    run,
+    run_benchmark,
+)
+
+__all__ = (
+    "FIELD_TYPES",
+    "OPERATIONS",
+    "Result",
+    "create_model",
+    "format_json",
+    "format_table",
+    "percentile",
+    "run",
+    "run_benchmark",
+)
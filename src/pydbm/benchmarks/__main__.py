@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import typing
+
+from pydbm.benchmarks.suite import FIELD_TYPES, OPERATIONS, format_json, format_table, run
+from pydbm.database.engines import BaseEngine
+
+__all__ = ("main",)
+
+
+def parse_args(argv: typing.Sequence[str] | None = None) -> argparse.Namespace:  # unexport: not-public
+    parser = argparse.ArgumentParser(
+        prog="python -m pydbm.benchmarks",
+        description="Time save, get, exists, count, all and filter of pydbm models and report ops/sec and latencies.",
+    )
+    parser.add_argument("--engines", nargs="+", default=[BaseEngine.default], choices=sorted(BaseEngine.engines), metavar="ENGINE", help="dbm backends, default: %(default)s")  # noqa: E501
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1_000, 10_000], metavar="SIZE", help="records of a table, from 1000 to 1000000, default: %(default)s")  # noqa: E501
+    parser.add_argument("--widths", nargs="+", type=int, default=[4], metavar="WIDTH", help="fields of a record, default: %(default)s")  # noqa: E501
+    parser.add_argument("--types", nargs="+", default=["str", "int"], choices=sorted(FIELD_TYPES), metavar="TYPE", help="field types the fields cycle through, default: %(default)s")  # noqa: E501
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=OPERATIONS, metavar="OPERATION", help="default: %(default)s")  # noqa: E501
+    parser.add_argument("--samples", type=int, default=1000, help="get and exists calls, default: %(default)s")
+    parser.add_argument("--repeat", type=int, default=5, help="count, all and filter calls, default: %(default)s")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random ids, default: %(default)s")
+    parser.add_argument("--directory", help="an empty directory for the databases, default: a temporary directory")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON to PATH, - for stdout")
+    args = parser.parse_args(argv)
+
+    if any(size < 1 for size in args.sizes) or any(width < 1 for width in args.widths):
+        parser.error("sizes and widths must be at least 1")
+    if args.samples < 1 or args.repeat < 1:
+        parser.error("samples and repeat must be at least 1")
+    return args
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = run(
+        engines=args.engines,
+        sizes=args.sizes,
+        widths=args.widths,
+        field_types=args.types,
+        operations=args.operations,
+        samples=args.samples,
+        repeat=args.repeat,
+        seed=args.seed,
+        directory=args.directory,
+    )
+
+    if args.json == "-":
+        print(format_json(results))
+    else:
+        print(format_table(results))
+        if args.json is not None:
+            with open(args.json, "w") as file:
+                file.write(format_json(results) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
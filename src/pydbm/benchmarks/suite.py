@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import contextlib
+import datetime
+import functools
+import json
+import math
+import os
+import random
+import tempfile
+import time
+import typing
+
+from pydbm.database.engines import BaseEngine
+from pydbm.models import DbmModel
+
+if typing.TYPE_CHECKING:
+    from pydbm.database import DatabaseManager
+
+__all__ = (
+    "FIELD_TYPES",
+    "OPERATIONS",
+    "Result",
+    "create_model",
+    "format_json",
+    "format_table",
+    "percentile",
+    "run",
+    "run_benchmark",
+)
+
+FIELD_TYPES: dict[str, tuple[type, typing.Callable[[int], typing.Any]]] = {
+    "bool": (bool, lambda i: i % 2 == 0),
+    "bytes": (bytes, lambda i: b"value-%d" % i),
+    "date": (datetime.date, lambda i: datetime.date.fromordinal(700_000 + i)),
+    "datetime": (datetime.datetime, lambda i: datetime.datetime(2020, 1, 1) + datetime.timedelta(seconds=i)),
+    "float": (float, lambda i: i / 3),
+    "int": (int, lambda i: i),
+    "str": (str, lambda i: f"value-{i}"),
+}
+OPERATIONS: tuple[str, ...] = ("save", "get", "exists", "count", "all", "filter")
+
+
+class Result(typing.NamedTuple):
+    engine: str
+    size: int
+    width: int
+    field_types: str
+    operation: str
+    ops: int
+    seconds: float
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+
+
+def percentile(latencies: typing.Sequence[float], percent: float) -> float:
+    """Return the nearest-rank percentile of the sorted latencies."""
+    if not latencies:
+        return 0.0
+    return latencies[max(0, math.ceil(percent / 100 * len(latencies)) - 1)]
+
+
+def create_model(*, engine: str, size: int, width: int, field_types: typing.Sequence[str]) -> typing.Type[DbmModel]:
+    """Create a model of width fields whose types cycle through field_types."""
+    annotations = {f"field{i}": FIELD_TYPES[field_types[i % len(field_types)]][0] for i in range(width)}
+    table_name = f"benchmark_{engine}_{size}_{width}_{'_'.join(field_types)}"
+    config = type("Config", (), {"table_name": table_name, "engine": engine})
+    model = typing.cast(
+        typing.Type[DbmModel],
+        type("BenchmarkModel", (DbmModel,), {"__annotations__": annotations, "Config": config}),
+    )
+    return model
+
+
+def run_benchmark(
+    *,
+    engine: str,
+    size: int,
+    width: int,
+    field_types: typing.Sequence[str],
+    operations: typing.Sequence[str] = OPERATIONS,
+    samples: int = 1000,
+    repeat: int = 5,
+    seed: int = 0,
+) -> list[Result]:
+    """Fill a new table with size records by single saves, then time the other operations on it.
+
+    get and exists run samples times on random ids, count, all and filter run repeat times on the whole table;
+    the latency of every call is measured and ops_per_sec is the number of calls per second.
+    """
+    model = create_model(engine=engine, size=size, width=width, field_types=field_types)
+    objects: DatabaseManager = model.objects
+    generators = [FIELD_TYPES[field_types[i % len(field_types)]][1] for i in range(width)]
+    randomizer = random.Random(seed)
+    records = [{f"field{i}": generator(row) for i, generator in enumerate(generators)} for row in range(size)]
+    ids: list[str] = []
+
+    def create(fields: dict[str, typing.Any]) -> None:
+        ids.append(objects.create(**fields).id)
+
+    def scan(**kwargs) -> int:
+        return sum(1 for _ in objects.filter(**kwargs)) if kwargs else sum(1 for _ in objects.all())
+
+    def save() -> typing.Iterator[typing.Callable[[], typing.Any]]:
+        for fields in records:
+            yield functools.partial(create, fields)
+
+    def get() -> typing.Iterator[typing.Callable[[], typing.Any]]:
+        for id in randomizer.choices(ids, k=samples):
+            yield functools.partial(objects.get, id=id)
+
+    def exists() -> typing.Iterator[typing.Callable[[], typing.Any]]:
+        for id in randomizer.choices(ids, k=samples):
+            yield functools.partial(objects.exists, id=id)
+
+    def count() -> typing.Iterator[typing.Callable[[], typing.Any]]:
+        for _ in range(repeat):
+            yield objects.count
+
+    def all() -> typing.Iterator[typing.Callable[[], typing.Any]]:
+        for _ in range(repeat):
+            yield scan
+
+    def filter() -> typing.Iterator[typing.Callable[[], typing.Any]]:
+        for _ in range(repeat):
+            value = records[randomizer.randrange(size)]["field0"]
+            yield functools.partial(scan, field0=value)
+
+    calls = {"save": save, "get": get, "exists": exists, "count": count, "all": all, "filter": filter}
+    results: list[Result] = []
+    for operation in ("save", *(operation for operation in operations if operation != "save")):
+        latencies: list[float] = []
+        for call in calls[operation]():
+            start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - start)
+
+        if operation in operations:
+            latencies.sort()
+            seconds = sum(latencies)
+            results.append(
+                Result(
+                    engine=objects.engine_name,
+                    size=size,
+                    width=width,
+                    field_types=",".join(field_types),
+                    operation=operation,
+                    ops=len(latencies),
+                    seconds=seconds,
+                    ops_per_sec=len(latencies) / seconds if seconds else 0.0,
+                    p50_ms=percentile(latencies, 50) * 1000,
+                    p99_ms=percentile(latencies, 99) * 1000,
+                )
+            )
+
+    objects.close()
+    return results
+
+
+def run(
+    *,
+    engines: typing.Sequence[str],
+    sizes: typing.Sequence[int],
+    widths: typing.Sequence[int],
+    field_types: typing.Sequence[str],
+    directory: str | None = None,
+    **kwargs,
+) -> list[Result]:
+    """Run the benchmark of every engine, size and width in directory, an empty one, or in a temporary directory."""
+    for engine in engines:
+        BaseEngine.get_engine(engine)
+
+    results: list[Result] = []
+    with contextlib.ExitStack() as stack:
+        if directory is None:
+            directory = stack.enter_context(tempfile.TemporaryDirectory(prefix="pydbm-benchmarks-"))
+
+        cwd = os.getcwd()
+        os.chdir(directory)  # NOTE: the databases are created in pydbm/ of the working directory
+        stack.callback(os.chdir, cwd)
+        for engine in engines:
+            for size in sizes:
+                for width in widths:
+                    results.extend(
+                        run_benchmark(engine=engine, size=size, width=width, field_types=field_types, **kwargs)
+                    )
+    return results
+
+
+def format_table(results: typing.Sequence[Result]) -> str:
+    header = ("engine", "size", "width", "field types", "operation", "ops", "ops/sec", "p50 ms", "p99 ms")
+    rows = [
+        (
+            result.engine,
+            str(result.size),
+            str(result.width),
+            result.field_types,
+            result.operation,
+            str(result.ops),
+            f"{result.ops_per_sec:,.0f}",
+            f"{result.p50_ms:.3f}",
+            f"{result.p99_ms:.3f}",
+        )
+        for result in results
+    ]
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    lines = [
+        "  ".join(cell.ljust(width) if i < 5 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths)))
+        for row in (header, *rows)
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def format_json(results: typing.Sequence[Result]) -> str:
+    return json.dumps([result._asdict() for result in results], indent=2)
@@ -1,5 +1,14 @@
+from pydbm.database.hooks import HookEvent
 from pydbm.database.manager import DatabaseManager
+from pydbm.database.snapshot import SnapshotManager
+from pydbm.database.stats import OperationStats, disable_stats, enable_stats, stats_enabled
 
 __all__ = (
     "DatabaseManager",
+    "HookEvent",
+    "OperationStats",
+    "SnapshotManager",
+    "disable_stats",
+    "enable_stats",
+    "stats_enabled",
 )
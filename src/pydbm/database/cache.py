@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import typing
+
+__all__ = (
+    "CacheInfo",
+    "RecordCache",
+)
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class RecordCache:
+    """Least recently used cache of decoded records keyed by id, entries expire after ttl seconds if it is set."""
+
+    __slots__ = (
+        "maxsize",
+        "ttl",
+        "records",
+        "hits",
+        "misses",
+        "evictions",
+        "lock",
+    )
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.records: collections.OrderedDict[str, tuple[dict[str, typing.Any], float | None]] = collections.OrderedDict()  # noqa: E501
+        self.hits = self.misses = self.evictions = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxsize={self.maxsize!r}, ttl={self.ttl!r})"
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, id: str) -> dict[str, typing.Any] | None:
+        """Return a copy of the cached fields of id, or None on a miss."""
+        with self.lock:
+            if (record := self.records.get(id, None)) is None:
+                self.misses += 1
+                return None
+
+            fields, expires_at = record
+            if expires_at is not None and expires_at < time.monotonic():
+                del self.records[id]
+                self.misses += 1
+                return None
+
+            self.records.move_to_end(id)
+            self.hits += 1
+        return dict(fields)
+
+    def set(self, id: str, fields: dict[str, typing.Any]) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            self.records[id] = (dict(fields), expires_at)
+            self.records.move_to_end(id)
+            while len(self.records) > self.maxsize:
+                self.records.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, id: str) -> None:
+        with self.lock:
+            self.records.pop(id, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.records.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self.records))
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import abc
+import bz2
+import lzma
+import typing
+import zlib
+
+__all__ = (
+    "BaseCompressor",
+    "Bz2Compressor",
+    "CompressionInfo",
+    "LzmaCompressor",
+    "ZlibCompressor",
+)
+
+
+class CompressionInfo(typing.NamedTuple):
+    records: int
+    compressed: int
+    raw_size: int
+    stored_size: int
+
+    @property
+    def ratio(self) -> float:
+        """Stored size over raw size of the written records, lower is better."""
+        return self.stored_size / self.raw_size if self.raw_size else 1.0
+
+
+class BaseCompressor(abc.ABC):
+    """Compress encoded records, a compressed record starts with the flag byte of its compressor.
+
+    The flags are 0x80 and above so they never clash with the format version bytes of the serializers,
+    a record is decompressed by the compressor that wrote it whatever `Config.compression` is.
+    """
+
+    compressors: dict[str, typing.Type[BaseCompressor]] = {}
+    flags: dict[int, typing.Type[BaseCompressor]] = {}
+
+    name: typing.ClassVar[str]
+    flag: typing.ClassVar[int]
+    prefix: typing.ClassVar[bytes]
+
+    def __init_subclass__(cls, name: str, flag: int, **kwargs):  # noqa
+        super().__init_subclass__(**kwargs)
+        cls.name = name
+        cls.flag = flag
+        cls.prefix = bytes((flag,))
+        cls.compressors[name] = cls
+        cls.flags[flag] = cls
+
+    @classmethod
+    def get_compressor(cls, name: str) -> typing.Type[BaseCompressor]:
+        try:
+            return cls.compressors[name]
+        except KeyError:
+            raise TypeError(f"Compression {name} is not supported yet!")
+
+    @staticmethod
+    @abc.abstractmethod
+    def compress(data: bytes) -> bytes:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def decompress(data: bytes) -> bytes:
+        pass
+
+
+class ZlibCompressor(BaseCompressor, name="zlib", flag=0x81):
+    @staticmethod
+    def compress(data: bytes) -> bytes:
+        return zlib.compress(data)
+
+    @staticmethod
+    def decompress(data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class LzmaCompressor(BaseCompressor, name="lzma", flag=0x82):
+    @staticmethod
+    def compress(data: bytes) -> bytes:
+        return lzma.compress(data)
+
+    @staticmethod
+    def decompress(data: bytes) -> bytes:
+        return lzma.decompress(data)
+
+
+class Bz2Compressor(BaseCompressor, name="bz2", flag=0x83):
+    @staticmethod
+    def compress(data: bytes) -> bytes:
+        return bz2.compress(data)
+
+    @staticmethod
+    def decompress(data: bytes) -> bytes:
+        return bz2.decompress(data)
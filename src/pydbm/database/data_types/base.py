@@ -24,6 +24,16 @@ class BaseDataType(abc.ABC):
     def set(value: typing.Any) -> str:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def from_bytes(value: bytes) -> typing.Any:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def to_bytes(value: typing.Any) -> bytes:
+        pass
+
     def __init_subclass__(cls, data_type: SupportedClassT, **kwargs):  # noqa
         super().__init_subclass__(**kwargs)
         cls.data_types[data_type] = cls
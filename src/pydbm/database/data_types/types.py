@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import struct
 
 from pydbm.database.data_types.base import BaseDataType
 
@@ -15,6 +16,8 @@ __all__ = (
     "StrDataType",
 )
 
+_DOUBLE = struct.Struct(">d")  # unexport: not-public
+
 
 class BoolDataType(BaseDataType, data_type=bool):
     mapping = {
@@ -30,6 +33,14 @@ class BoolDataType(BaseDataType, data_type=bool):
     def set(value: bool) -> str:
         return str(value)
 
+    @staticmethod
+    def from_bytes(value: bytes) -> bool:
+        return value == b"\x01"
+
+    @staticmethod
+    def to_bytes(value: bool) -> bytes:
+        return b"\x01" if value else b"\x00"
+
 
 class BytesDataType(BaseDataType, data_type=bytes):
     @classmethod
@@ -40,6 +51,14 @@ class BytesDataType(BaseDataType, data_type=bytes):
     def set(value: bytes) -> str:
         return value.decode("utf-8")
 
+    @staticmethod
+    def from_bytes(value: bytes) -> bytes:
+        return bytes(value)
+
+    @staticmethod
+    def to_bytes(value: bytes) -> bytes:
+        return value
+
 
 class DateDataType(BaseDataType, data_type=datetime.date):
     @classmethod
@@ -50,6 +69,14 @@ class DateDataType(BaseDataType, data_type=datetime.date):
     def set(value: datetime.date) -> str:
         return value.isoformat()
 
+    @staticmethod
+    def from_bytes(value: bytes) -> datetime.date:
+        return datetime.date.fromordinal(int.from_bytes(value, "big"))
+
+    @staticmethod
+    def to_bytes(value: datetime.date) -> bytes:
+        return value.toordinal().to_bytes(3, "big")
+
 
 class DateTimeDataType(BaseDataType, data_type=datetime.datetime):
     @classmethod
@@ -60,6 +87,14 @@ class DateTimeDataType(BaseDataType, data_type=datetime.datetime):
     def set(value: datetime.datetime) -> str:
         return value.isoformat()
 
+    @staticmethod
+    def from_bytes(value: bytes) -> datetime.datetime:
+        return datetime.datetime.fromisoformat(str(value, "ascii"))
+
+    @staticmethod
+    def to_bytes(value: datetime.datetime) -> bytes:
+        return bytes(value.isoformat(), "ascii")
+
 
 class FloatDataType(BaseDataType, data_type=float):
     @classmethod
@@ -70,6 +105,14 @@ class FloatDataType(BaseDataType, data_type=float):
     def set(value: float) -> str:
         return str(value)
 
+    @staticmethod
+    def from_bytes(value: bytes) -> float:
+        return _DOUBLE.unpack(value)[0]
+
+    @staticmethod
+    def to_bytes(value: float) -> bytes:
+        return _DOUBLE.pack(value)
+
 
 class IntDataType(BaseDataType, data_type=int):
     @classmethod
@@ -80,6 +123,14 @@ class IntDataType(BaseDataType, data_type=int):
     def set(value: int) -> str:
         return str(value)
 
+    @staticmethod
+    def from_bytes(value: bytes) -> int:
+        return int.from_bytes(value, "big", signed=True)
+
+    @staticmethod
+    def to_bytes(value: int) -> bytes:
+        return value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True)
+
 
 class NoneDataType(BaseDataType, data_type=None):
     @classmethod
@@ -90,6 +141,14 @@ class NoneDataType(BaseDataType, data_type=None):
     def set(value: None) -> str:
         return str(value)
 
+    @staticmethod
+    def from_bytes(value: bytes) -> None:
+        return None
+
+    @staticmethod
+    def to_bytes(value: None) -> bytes:
+        return b""
+
 
 class StrDataType(BaseDataType, data_type=str):
     @classmethod
@@ -99,3 +158,11 @@ class StrDataType(BaseDataType, data_type=str):
     @staticmethod
     def set(value: str) -> str:
         return str(value)
+
+    @staticmethod
+    def from_bytes(value: bytes) -> str:
+        return str(value, "utf-8")
+
+    @staticmethod
+    def to_bytes(value: str) -> bytes:
+        return bytes(value, "utf-8")
@@ -0,0 +1,29 @@
+from pydbm.database.engines.base import BaseEngine, iter_keys, set_default_engine
+from pydbm.database.engines.log import LogDatabase, LogEngine, LogFile
+from pydbm.database.engines.types import (
+    DbmEngine,
+    DumbEngine,
+    GnuEngine,
+    MemoryDatabase,
+    MemoryEngine,
+    NdbmEngine,
+    SqliteDatabase,
+    SqliteEngine,
+)
+
+__all__ = (
+    "BaseEngine",
+    "DbmEngine",
+    "DumbEngine",
+    "GnuEngine",
+    "LogDatabase",
+    "LogEngine",
+    "LogFile",
+    "MemoryDatabase",
+    "MemoryEngine",
+    "NdbmEngine",
+    "SqliteDatabase",
+    "SqliteEngine",
+    "iter_keys",
+    "set_default_engine",
+)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import abc
+import typing
+
+__all__ = (
+    "BaseEngine",
+    "iter_keys",
+    "set_default_engine",
+)
+
+
+class BaseEngine(abc.ABC):
+    """Open the database handles of a storage backend.
+
+    A handle behaves like the objects returned by `dbm.open`: a mapping of bytes keys to bytes values, that takes
+    str keys as well, with `close`; `sync` and a `firstkey`/`nextkey` cursor are optional.
+    """
+
+    engines: dict[str, typing.Type[BaseEngine]] = {}
+    default: typing.ClassVar[str] = "dbm"
+
+    name: typing.ClassVar[str]
+    multiprocess: typing.ClassVar[bool] = True  # NOTE: whether other processes can open its databases to read them
+
+    def __init_subclass__(cls, name: str | None = None, **kwargs):  # noqa
+        super().__init_subclass__(**kwargs)
+        if name is not None:  # NOTE: intermediate classes are not registered
+            cls.name = name
+            cls.engines[name] = cls
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    @classmethod
+    def get_engine(cls, name: str | None = None) -> typing.Type[BaseEngine]:
+        """Return the engine registered with name, or the default engine when name is None."""
+        try:
+            return cls.engines[name if name is not None else cls.default]
+        except KeyError:
+            raise TypeError(f"Engine {name} is not supported yet!")
+
+    @abc.abstractmethod
+    def open(self, path: str, flag: str = "c"):
+        """Open the database at path, flag is one of "r", "w", "c" and "n" as in `dbm.open`."""
+
+    def backend(self, path: str) -> str:
+        """Return the name of the backend that is used for the database at path."""
+        return self.name
+
+
+def set_default_engine(name: str) -> None:
+    """Set the engine of the models whose Config has no engine, it must be called before the models are defined."""
+    BaseEngine.default = BaseEngine.get_engine(name).name
+
+
+def iter_keys(db) -> typing.Iterator[bytes]:
+    """Stream the keys of an open database one by one.
+
+    dbm.gnu walks its own cursor with firstkey/nextkey, the other backends have no cursor so their key list
+    is taken once; the records are read lazily in both cases.
+    """
+    if hasattr(db, "firstkey"):
+        key: bytes | None = db.firstkey()
+        while key is not None:
+            yield key
+            key = db.nextkey(key)
+    else:
+        yield from db.keys()
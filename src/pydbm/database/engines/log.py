@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import atexit
+import collections.abc
+import dbm
+import os
+import struct
+import threading
+import typing
+import zlib
+
+from pydbm.database.engines.base import BaseEngine
+from pydbm.database.engines.types import KeyT, to_bytes
+from pydbm.logging import logger
+
+__all__ = (
+    "LogDatabase",
+    "LogEngine",
+    "LogFile",
+)
+
+RECORD_HEADER = struct.Struct(">IIi")  # unexport: not-public
+HINT_HEADER = struct.Struct(">Q")  # unexport: not-public
+HINT_ENTRY = struct.Struct(">IQI")  # unexport: not-public
+TOMBSTONE: int = -1  # unexport: not-public
+
+
+def pack_record(key: bytes, value: bytes | None) -> bytes:  # unexport: not-public
+    value_length = TOMBSTONE if value is None else len(value)
+    body = key + (value or b"")
+    return RECORD_HEADER.pack(zlib.crc32(body), len(key), value_length) + body
+
+
+class LogFile:
+    """An append-only log of records with an in-memory index of key to value offset, as in Bitcask.
+
+    Writes are appended to the end of the log and reads are a single pread. Overwritten and deleted records stay
+    in the log until `compact` rewrites it; the index is loaded from the hint file that is written on sync and
+    close, or rebuilt by reading the whole log when the hint file is stale.
+    """
+
+    __slots__ = (
+        "path",
+        "hint_path",
+        "fd",
+        "index",
+        "size",
+        "garbage",
+        "lock",
+        "compaction",
+        "compaction_ratio",
+        "compaction_min_size",
+    )
+
+    def __init__(self, path: str, *, compaction_ratio: float = 0.5, compaction_min_size: int = 4 * 1024 * 1024) -> None:  # noqa: E501
+        self.path = path
+        self.hint_path = path + ".hint"
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min_size = compaction_min_size
+
+        self.lock = threading.RLock()
+        self.compaction: threading.Thread | None = None
+        self.index: dict[bytes, tuple[int, int]] = {}
+        self.size = self.garbage = 0
+
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644)
+        if not self.load_hint():
+            self.load_log()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the log file on the disk has been removed or replaced by someone else."""
+        try:
+            return os.stat(self.path).st_ino != os.fstat(self.fd).st_ino
+        except OSError:
+            return True
+
+    def load_hint(self) -> bool:
+        try:
+            with open(self.hint_path, "rb") as file:
+                hint = file.read()
+        except FileNotFoundError:
+            return False
+
+        log_size = os.fstat(self.fd).st_size
+        if len(hint) < HINT_HEADER.size or HINT_HEADER.unpack_from(hint)[0] != log_size:
+            return False
+
+        offset = HINT_HEADER.size
+        while offset < len(hint):
+            key_length, value_offset, value_length = HINT_ENTRY.unpack_from(hint, offset)
+            offset += HINT_ENTRY.size
+            self.index[hint[offset:offset + key_length]] = (value_offset, value_length)
+            offset += key_length
+
+        self.size = log_size
+        self.garbage = log_size - sum(
+            RECORD_HEADER.size + len(key) + value_length for key, (_, value_length) in self.index.items()
+        )
+        return True
+
+    def load_log(self) -> None:
+        self.index, self.size, self.garbage = {}, 0, 0
+        for key, value_offset, value_length, record_size in self.iter_records(0):
+            self.apply(key, value_offset, value_length, record_size)
+
+        if self.size != os.fstat(self.fd).st_size:
+            logger.warning(f"{self.path} has a truncated or corrupted tail, it is dropped from the offset {self.size}.")
+            os.truncate(self.path, self.size)
+
+    def iter_records(self, start: int) -> typing.Iterator[tuple[bytes, int, int, int]]:
+        """Read the records of the log from start, it stops at the end or at the first corrupted record."""
+        offset = start
+        while len(header := self.read(offset, RECORD_HEADER.size)) == RECORD_HEADER.size:
+            checksum, key_length, value_length = RECORD_HEADER.unpack(header)
+            body = self.read(offset + RECORD_HEADER.size, key_length + max(value_length, 0))
+            if len(body) != key_length + max(value_length, 0) or zlib.crc32(body) != checksum:
+                break
+
+            record_size = RECORD_HEADER.size + len(body)
+            yield body[:key_length], offset + RECORD_HEADER.size + key_length, value_length, record_size
+            offset += record_size
+
+    def apply(self, key: bytes, value_offset: int, value_length: int, record_size: int) -> None:
+        if (old := self.index.pop(key, None)) is not None:
+            self.garbage += RECORD_HEADER.size + len(key) + old[1]
+        if value_length == TOMBSTONE:
+            self.garbage += record_size
+        else:
+            self.index[key] = (value_offset, value_length)
+        self.size += record_size
+
+    def read(self, offset: int, length: int) -> bytes:
+        if hasattr(os, "pread"):
+            return os.pread(self.fd, length, offset)
+
+        with self.lock:  # NOTE: Windows has no pread
+            os.lseek(self.fd, offset, os.SEEK_SET)
+            return os.read(self.fd, length)
+
+    def get(self, key: bytes) -> bytes | None:
+        with self.lock:
+            if (location := self.index.get(key, None)) is None:
+                return None
+            return self.read(*location)
+
+    def put(self, key: bytes, value: bytes | None) -> None:
+        record = pack_record(key, value)
+        with self.lock:
+            if value is None and key not in self.index:
+                raise KeyError(key)
+
+            os.write(self.fd, record)
+            self.apply(key, self.size + RECORD_HEADER.size + len(key), len(value) if value is not None else TOMBSTONE, len(record))  # noqa: E501
+            if self.needs_compaction():
+                self.compact(background=True)
+
+    def needs_compaction(self) -> bool:
+        return (
+            self.compaction is None
+            and self.size >= self.compaction_min_size
+            and self.garbage >= self.size * self.compaction_ratio
+        )
+
+    def compact(self, *, background: bool = False) -> None:
+        """Rewrite the log with only the live records, writes that arrive meanwhile are replayed on the new log."""
+        with self.lock:
+            if self.compaction is not None:
+                return
+            if background:
+                self.compaction = threading.Thread(target=self._compact, name=f"pydbm-compact-{self.path}", daemon=True)  # noqa: E501
+                self.compaction.start()
+                return
+            self.compaction = threading.current_thread()
+        self._compact()
+
+    def _compact(self) -> None:
+        compact_path = self.path + ".compact"
+        try:
+            with self.lock:
+                snapshot, end = dict(self.index), self.size
+
+            index: dict[bytes, tuple[int, int]] = {}
+            size = 0
+            with open(compact_path, "wb") as file:
+                for key, (value_offset, value_length) in snapshot.items():
+                    size += self._copy(file, index, size, key, self.read(value_offset, value_length))
+
+                with self.lock:
+                    tail: dict[bytes, tuple[int, int]] = {}  # NOTE: only the last write of a key is replayed
+                    for key, value_offset, value_length, _ in self.iter_records(end):
+                        tail[key] = (value_offset, value_length)
+                    for key, (value_offset, value_length) in tail.items():
+                        value = None if value_length == TOMBSTONE else self.read(value_offset, value_length)
+                        size += self._copy(file, index, size, key, value)
+
+                    file.flush()
+                    os.fsync(file.fileno())
+                    os.replace(compact_path, self.path)
+                    os.close(self.fd)
+                    self.fd = os.open(self.path, os.O_RDWR | os.O_APPEND | getattr(os, "O_BINARY", 0))
+                    self.index, self.size = index, size
+                    self.garbage = size - sum(
+                        RECORD_HEADER.size + len(key) + value_length for key, (_, value_length) in index.items()
+                    )
+                    self.write_hint()
+        finally:
+            with self.lock:
+                self.compaction = None
+            if os.path.exists(compact_path):
+                os.remove(compact_path)
+
+    @staticmethod
+    def _copy(file: typing.BinaryIO, index: dict[bytes, tuple[int, int]], offset: int, key: bytes, value: bytes | None) -> int:  # noqa: E501
+        if value is None:
+            if index.pop(key, None) is None:
+                return 0
+            record = pack_record(key, None)
+        else:
+            record = pack_record(key, value)
+            index[key] = (offset + RECORD_HEADER.size + len(key), len(value))
+        file.write(record)
+        return len(record)
+
+    def write_hint(self) -> None:
+        with self.lock:
+            entries = [HINT_HEADER.pack(self.size)]
+            for key, (value_offset, value_length) in self.index.items():
+                entries.append(HINT_ENTRY.pack(len(key), value_offset, value_length))
+                entries.append(key)
+
+        hint_path = self.hint_path + ".tmp"
+        with open(hint_path, "wb") as file:
+            file.write(b"".join(entries))
+        os.replace(hint_path, self.hint_path)
+
+    def sync(self) -> None:
+        with self.lock:
+            os.fsync(self.fd)
+            self.write_hint()
+
+    def wait(self) -> None:
+        """Wait for a background compaction to finish."""
+        if (compaction := self.compaction) is not None and compaction is not threading.current_thread():
+            compaction.join()
+
+    def close(self) -> None:
+        self.wait()
+        if not self.is_stale:
+            self.sync()
+        os.close(self.fd)
+
+
+class LogDatabase(collections.abc.MutableMapping):
+    """A handle of a `LogFile`, the log stays open in the process after the handle is closed."""
+
+    __slots__ = (
+        "log",
+        "readonly",
+        "closed",
+    )
+
+    def __init__(self, log: LogFile, *, readonly: bool = False) -> None:
+        self.log = log
+        self.readonly = readonly
+        self.closed = False
+
+    def __getitem__(self, key: KeyT) -> bytes:
+        self.check()
+        if (value := self.log.get(to_bytes(key))) is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: KeyT, value: KeyT) -> None:
+        self.check(write=True)
+        self.log.put(to_bytes(key), to_bytes(value))
+
+    def __delitem__(self, key: KeyT) -> None:
+        self.check(write=True)
+        self.log.put(to_bytes(key), None)
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        self.check()
+        with self.log.lock:
+            return iter(list(self.log.index))
+
+    def __len__(self) -> int:
+        self.check()
+        return len(self.log.index)
+
+    def __contains__(self, key: object) -> bool:
+        self.check()
+        return to_bytes(key) in self.log.index  # type: ignore[arg-type]
+
+    def check(self, *, write: bool = False) -> None:
+        if self.closed:
+            raise dbm.error[0]("Database object has already been closed")
+        if write and self.readonly:
+            raise dbm.error[0]("The database is opened for reading only")
+
+    def keys(self) -> list[bytes]:  # type: ignore[override]
+        return list(self)
+
+    def compact(self, *, background: bool = False) -> None:
+        self.check(write=True)
+        self.log.compact(background=background)
+
+    def sync(self) -> None:
+        self.check()
+        self.log.sync()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class LogEngine(BaseEngine, name="log"):
+    """Append-only log files with an in-memory index, for update heavy workloads of a single process.
+
+    The logs stay open in the process until `close_all` runs at interpreter exit, so opening a handle is cheap.
+    """
+
+    files: typing.ClassVar[dict[str, LogFile]] = {}
+    multiprocess = False
+    lock: typing.ClassVar[threading.Lock] = threading.Lock()
+
+    def open(self, path: str, flag: str = "c") -> LogDatabase:
+        log_path = path + ".log"
+        with self.lock:
+            if (log := self.files.get(log_path, None)) is not None and log.is_stale:
+                del self.files[log_path]
+                log.close()
+                log = None
+
+            if flag in ("r", "w") and log is None and not os.path.exists(log_path):
+                raise dbm.error[0](f"Database {path} does not exist")
+            if flag == "n":
+                if log is not None:
+                    del self.files[log_path]
+                    log.close()
+                for stale_path in (log_path, log_path + ".hint"):
+                    if os.path.exists(stale_path):
+                        os.remove(stale_path)
+                log = None
+
+            if log is None:
+                log = self.files[log_path] = LogFile(log_path)
+        return LogDatabase(log, readonly=flag == "r")
+
+    def backend(self, path: str) -> str:
+        return "log"
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls.lock:
+            files, cls.files = cls.files, {}
+        for log in files.values():
+            log.close()
+
+
+atexit.register(LogEngine.close_all)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import collections.abc
+import dbm
+import importlib
+import sqlite3
+import typing
+
+from pydbm.database.engines.base import BaseEngine
+
+__all__ = (
+    "DbmEngine",
+    "DumbEngine",
+    "GnuEngine",
+    "MemoryDatabase",
+    "MemoryEngine",
+    "NdbmEngine",
+    "SqliteDatabase",
+    "SqliteEngine",
+)
+
+KeyT = typing.Union[str, bytes]  # unexport: not-public
+
+
+def to_bytes(value: KeyT) -> bytes:  # unexport: not-public
+    return bytes(value, "utf-8") if isinstance(value, str) else bytes(value)
+
+
+class DbmEngine(BaseEngine, name="dbm"):
+    """The backend that `dbm.open` picks on the host, it is the default engine."""
+
+    def open(self, path: str, flag: str = "c"):
+        return dbm.open(path, flag)  # type: ignore[arg-type]
+
+    def backend(self, path: str) -> str:
+        return dbm.whichdb(path) or self.name
+
+
+class _ModuleEngine(BaseEngine):  # unexport: not-public
+    module_name: typing.ClassVar[str]
+
+    def open(self, path: str, flag: str = "c"):
+        return importlib.import_module(self.module_name).open(path, flag)  # type: ignore[attr-defined]
+
+    def backend(self, path: str) -> str:
+        return self.module_name
+
+
+class GnuEngine(_ModuleEngine, name="gnu"):
+    module_name = "dbm.gnu"
+
+
+class NdbmEngine(_ModuleEngine, name="ndbm"):
+    module_name = "dbm.ndbm"
+
+
+class DumbEngine(_ModuleEngine, name="dumb"):
+    module_name = "dbm.dumb"
+
+
+class MemoryDatabase(collections.abc.MutableMapping):
+    """A dict backed handle, its data lives as long as the process."""
+
+    __slots__ = (
+        "data",
+        "closed",
+    )
+
+    def __init__(self, data: dict[bytes, bytes]) -> None:
+        self.data = data
+        self.closed = False
+
+    def __getitem__(self, key: KeyT) -> bytes:
+        self.check()
+        return self.data[to_bytes(key)]
+
+    def __setitem__(self, key: KeyT, value: KeyT) -> None:
+        self.check()
+        self.data[to_bytes(key)] = to_bytes(value)
+
+    def __delitem__(self, key: KeyT) -> None:
+        self.check()
+        del self.data[to_bytes(key)]
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        self.check()
+        return iter(list(self.data))
+
+    def __len__(self) -> int:
+        self.check()
+        return len(self.data)
+
+    def __contains__(self, key: object) -> bool:
+        self.check()
+        return to_bytes(key) in self.data  # type: ignore[arg-type]
+
+    def check(self) -> None:
+        if self.closed:
+            raise dbm.error[0]("Database object has already been closed")
+
+    def keys(self) -> list[bytes]:  # type: ignore[override]
+        return list(self)
+
+    def close(self) -> None:
+        self.closed = True
+
+    def sync(self) -> None:
+        self.check()
+
+
+class MemoryEngine(BaseEngine, name="memory"):
+    """Keep the databases in dictionaries of the process, useful for tests and caches."""
+
+    databases: typing.ClassVar[dict[str, dict[bytes, bytes]]] = {}
+    multiprocess = False
+
+    def open(self, path: str, flag: str = "c") -> MemoryDatabase:
+        if flag == "n":
+            self.databases[path] = {}
+        elif flag in ("r", "w") and path not in self.databases:
+            raise dbm.error[0](f"Database {path} does not exist")
+        return MemoryDatabase(self.databases.setdefault(path, {}))
+
+    @classmethod
+    def drop(cls, path: str) -> None:
+        cls.databases.pop(path, None)
+
+
+class SqliteDatabase(collections.abc.MutableMapping):
+    """A handle that keeps the records in a key value table of a sqlite3 database."""
+
+    __slots__ = (
+        "connection",
+        "readonly",
+    )
+
+    def __init__(self, path: str, flag: str = "c") -> None:
+        self.readonly = flag == "r"
+        if flag in ("r", "w"):
+            mode = "ro" if self.readonly else "rw"
+            self.connection = sqlite3.connect(f"file:{path}?mode={mode}", uri=True, check_same_thread=False)
+        else:
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+
+        if not self.readonly:
+            with self.connection:
+                self.connection.execute("CREATE TABLE IF NOT EXISTS pydbm (key BLOB PRIMARY KEY, value BLOB NOT NULL)")
+                if flag == "n":
+                    self.connection.execute("DELETE FROM pydbm")
+
+    def __getitem__(self, key: KeyT) -> bytes:
+        row = self.connection.execute("SELECT value FROM pydbm WHERE key = ?", (to_bytes(key),)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __setitem__(self, key: KeyT, value: KeyT) -> None:
+        self.connection.execute("REPLACE INTO pydbm (key, value) VALUES (?, ?)", (to_bytes(key), to_bytes(value)))
+
+    def __delitem__(self, key: KeyT) -> None:
+        if self.connection.execute("DELETE FROM pydbm WHERE key = ?", (to_bytes(key),)).rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        key = self.firstkey()
+        while key is not None:
+            yield key
+            key = self.nextkey(key)
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM pydbm").fetchone()[0]
+
+    def __contains__(self, key: object) -> bool:
+        query = "SELECT 1 FROM pydbm WHERE key = ?"
+        return self.connection.execute(query, (to_bytes(key),)).fetchone() is not None  # type: ignore[arg-type]
+
+    def firstkey(self) -> bytes | None:
+        row = self.connection.execute("SELECT key FROM pydbm ORDER BY key LIMIT 1").fetchone()
+        return row[0] if row is not None else None
+
+    def nextkey(self, key: KeyT) -> bytes | None:
+        query = "SELECT key FROM pydbm WHERE key > ? ORDER BY key LIMIT 1"
+        row = self.connection.execute(query, (to_bytes(key),)).fetchone()
+        return row[0] if row is not None else None
+
+    def close(self) -> None:
+        self.sync()
+        self.connection.close()
+
+    def sync(self) -> None:
+        if not self.readonly:
+            self.connection.commit()
+
+
+class SqliteEngine(BaseEngine, name="sqlite"):
+    def open(self, path: str, flag: str = "c") -> SqliteDatabase:
+        return SqliteDatabase(path, flag)
+
+    def backend(self, path: str) -> str:
+        return "sqlite3"
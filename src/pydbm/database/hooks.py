@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+import typing
+
+__all__ = (
+    "HOOK_OPERATIONS",
+    "HOOK_STAGES",
+    "HookEvent",
+    "HookT",
+    "Hooks",
+)
+
+HOOK_OPERATIONS: tuple[str, ...] = ("save", "get", "delete", "filter", "scan")
+HOOK_STAGES: tuple[str, ...] = ("pre", "post")
+
+
+class HookEvent(typing.NamedTuple):
+    """An operation of a table, pre events have no duration; size is the bytes of the record when it is known."""
+
+    operation: str
+    stage: str
+    table_name: str
+    id: str | None
+    duration: float | None
+    size: int | None
+
+
+HookT = typing.Callable[[HookEvent], None]
+
+
+class Hooks:
+    """The pre and post callbacks of the operations of a table.
+
+    Only the operations that have a callback are in `callbacks`, so the call sites check `operation in
+    hooks.callbacks` before they read the clock or build an event, an operation without hooks pays nothing else.
+    """
+
+    __slots__ = (
+        "table_name",
+        "callbacks",
+    )
+
+    def __init__(self, table_name: str) -> None:
+        self.table_name = table_name
+        self.callbacks: dict[str, dict[str, list[HookT]]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(table_name={self.table_name!r}, operations={list(self.callbacks)!r})"
+
+    def add(self, operation: str, callback: HookT, *, stage: str = "post") -> None:
+        self._check(operation, stage)
+        self.callbacks.setdefault(operation, {"pre": [], "post": []})[stage].append(callback)
+
+    def remove(self, operation: str, callback: HookT, *, stage: str = "post") -> None:
+        """Remove a callback added with the same operation and stage, ValueError is raised if there is none."""
+        self._check(operation, stage)
+        stages = self.callbacks.get(operation, {"pre": [], "post": []})
+        stages[stage].remove(callback)
+        if not any(stages.values()):
+            del self.callbacks[operation]
+
+    def clear(self) -> None:
+        self.callbacks.clear()
+
+    def pre(self, operation: str, id: str | None, size: int | None = None) -> float:
+        """Run the pre callbacks of operation and return the start time of the operation."""
+        if callbacks := self.callbacks.get(operation, {}).get("pre"):
+            event = HookEvent(operation, "pre", self.table_name, id, None, size)
+            for callback in callbacks:
+                callback(event)
+        return time.perf_counter()
+
+    def post(self, operation: str, id: str | None, start: float, size: int | None = None) -> None:
+        """Run the post callbacks of operation that started at start."""
+        duration = time.perf_counter() - start
+        if callbacks := self.callbacks.get(operation, {}).get("post"):
+            event = HookEvent(operation, "post", self.table_name, id, duration, size)
+            for callback in callbacks:
+                callback(event)
+
+    @staticmethod
+    def _check(operation: str, stage: str) -> None:
+        if operation not in HOOK_OPERATIONS:
+            raise TypeError(f"Hook {operation} is not supported yet!")
+        if stage not in HOOK_STAGES:
+            raise ValueError(f"stage must be one of {HOOK_STAGES}")
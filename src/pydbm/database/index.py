@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import typing
+
+from pydbm.database.data_types import BaseDataType
+
+if typing.TYPE_CHECKING:
+    from pydbm.database.engines import BaseEngine
+    from pydbm.typing_extra import SupportedClassT
+
+__all__ = (
+    "SecondaryIndex",
+)
+
+ID_SEPARATOR: bytes = b"\x00"  # unexport: not-public
+CHUNK_SIZE: int = 128  # unexport: not-public
+HEAD: bytes = b"h"  # unexport: not-public
+CHUNK: bytes = b"c"  # unexport: not-public
+MEMBER: bytes = b"m"  # unexport: not-public
+
+
+class SecondaryIndex:
+    """Map every value of a field to the ids of the records that hold it, in a sidecar dbm file.
+
+    The ids of a value are stored in chunks of at most CHUNK_SIZE ids and every id has a member key that points
+    at its chunk, so adding or discarding an id rewrites at most two chunks instead of every id of the value; the
+    head key of a value holds its number of chunks and of ids. Every chunk but the last one is full.
+    """
+
+    __slots__ = (
+        "field_name",
+        "field_type",
+        "db_path",
+        "engine",
+        "db",
+        "to_bytes",
+        "flag",
+        "__is_db_open",
+    )
+
+    def __init__(self, *, field_name: str, field_type: SupportedClassT, db_path: str, engine: BaseEngine) -> None:
+        self.field_name = field_name
+        self.field_type = field_type
+        self.db_path = db_path
+        self.engine = engine
+        self.to_bytes = BaseDataType.get_data_type(field_type).to_bytes
+        self.flag: str = "c"  # NOTE: the flag of the table handle, "r" under the shared process lock
+
+        self.__is_db_open: bool = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(field_name={self.field_name!r}, db_path={self.db_path!r})"
+
+    def open(self):
+        if not self.__is_db_open:
+            self.db = self.engine.open(self.db_path, self.flag)
+            self.__is_db_open = True
+        return self.db
+
+    def close(self) -> None:
+        if self.__is_db_open:
+            self.db.close()
+            self.__is_db_open = False
+
+    def flush(self) -> None:
+        if self.__is_db_open and hasattr(self.db, "sync"):
+            self.db.sync()
+
+    def clear(self) -> None:
+        self.close()
+        self.db = self.engine.open(self.db_path, "n")
+        self.__is_db_open = True
+
+    def supports(self, value: typing.Any) -> bool:
+        """Whether value can be looked up, the index only holds values of the field type."""
+        return value is None if self.field_type is None else value.__class__ is self.field_type
+
+    def get(self, value: typing.Any) -> set[str]:
+        db, value_bytes = self.open(), self.to_bytes(value)
+        if (head := db.get(self._key(HEAD, value_bytes), None)) is None:
+            return set()
+
+        ids: set[str] = set()
+        for chunk in range(int(head.split(b",")[0])):
+            if data := db.get(self._key(CHUNK, value_bytes, chunk), None):
+                ids.update(str(data, "utf-8").split("\x00"))
+        return ids
+
+    def add(self, value: typing.Any, id: str) -> None:
+        db, value_bytes, id_bytes = self.open(), self.to_bytes(value), bytes(id, "utf-8")
+        member_key = self._key(MEMBER, value_bytes, id_bytes)
+        if member_key in db:
+            return
+
+        head_key = self._key(HEAD, value_bytes)
+        chunks, count = map(int, db.get(head_key, b"0,0").split(b","))
+        data: bytes | None = db.get(self._key(CHUNK, value_bytes, chunks - 1), None) if chunks else None
+        if data is None or data.count(ID_SEPARATOR) + 1 >= CHUNK_SIZE:  # NOTE: the last chunk is full, start one
+            chunk, chunks, data = chunks, chunks + 1, id_bytes
+        else:
+            chunk, data = chunks - 1, data + ID_SEPARATOR + id_bytes if data else id_bytes
+
+        db[self._key(CHUNK, value_bytes, chunk)] = data
+        db[member_key] = bytes(str(chunk), "ascii")
+        db[head_key] = bytes(f"{chunks},{count + 1}", "ascii")
+
+    def discard(self, value: typing.Any, id: str) -> None:
+        db, value_bytes, id_bytes = self.open(), self.to_bytes(value), bytes(id, "utf-8")
+        member_key = self._key(MEMBER, value_bytes, id_bytes)
+        if (chunk := db.get(member_key, None)) is None:
+            return
+
+        head_key = self._key(HEAD, value_bytes)
+        chunks, count = map(int, db[head_key].split(b","))
+        del db[member_key]
+        if count == 1:
+            for _chunk in range(chunks):
+                if (chunk_key := self._key(CHUNK, value_bytes, _chunk)) in db:  # NOTE: dbm.gnu has no pop
+                    del db[chunk_key]
+            del db[head_key]
+            return
+
+        chunk_key, last_key = self._key(CHUNK, value_bytes, int(chunk)), self._key(CHUNK, value_bytes, chunks - 1)
+        ids = db[chunk_key].split(ID_SEPARATOR)
+        ids.remove(id_bytes)
+        if chunk_key != last_key:  # NOTE: an id of the last chunk fills the hole, so only the last one is not full
+            last_ids = db[last_key].split(ID_SEPARATOR)
+            moved = last_ids.pop()
+            ids.append(moved)
+            db[chunk_key] = ID_SEPARATOR.join(ids)
+            db[self._key(MEMBER, value_bytes, moved)] = chunk
+            ids = last_ids
+
+        if ids:
+            db[last_key] = ID_SEPARATOR.join(ids)
+        else:
+            del db[last_key]
+            chunks -= 1
+        db[head_key] = bytes(f"{chunks},{count - 1}", "ascii")
+
+    @staticmethod
+    def _key(kind: bytes, value_bytes: bytes, suffix: bytes | int = b"") -> bytes:
+        """Length prefix the value so no value, chunk number or id can make two kinds of keys equal."""
+        if isinstance(suffix, int):
+            suffix = bytes(str(suffix), "ascii")
+        return kind + len(value_bytes).to_bytes(4, "big") + value_bytes + suffix
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from pydbm import DbmModel
+    from pydbm.database.manager import DatabaseManager
+
+__all__ = (
+    "LazyModel",
+)
+
+
+class LazyModel:
+    """A record of a scan that is decoded on the first field access and built as a model only when needed."""
+
+    __slots__ = (
+        "id",
+        "_manager",
+        "_data",
+        "_fields",
+        "_model",
+    )
+
+    def __init__(self, *, manager: DatabaseManager, id: str, data: bytes) -> None:
+        self.id = id
+        self._manager = manager
+        self._data = data
+        self._fields: dict[str, typing.Any] | None = None
+        self._model: DbmModel | None = None
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        fields = self.fields
+        if name in fields:
+            return fields[name]
+        return getattr(self.to_model(), name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyModel):
+            other = other.to_model()
+        return self.to_model() == other
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._manager.model.__name__}, id={self.id!r})"
+
+    @property
+    def fields(self) -> dict[str, typing.Any]:
+        if self._fields is None:
+            self._fields = self._manager._decode(self._data)
+        return self._fields
+
+    def to_model(self) -> DbmModel:
+        if self._model is None:
+            self._model = self._manager._build(self.id, self.fields)
+        return self._model
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+import typing
+
+from pydbm.exceptions import LockTimeoutError
+
+try:
+    import fcntl
+except ImportError:  # NOTE: Windows has no fcntl
+    fcntl = None  # type: ignore[assignment]
+
+__all__ = (
+    "FileLock",
+    "RWLock",
+)
+
+MIN_DELAY: float = 0.001  # unexport: not-public
+MAX_DELAY: float = 0.05  # unexport: not-public
+
+
+class RWLock:
+    """A reader/writer lock, readers share it while a writer holds it alone.
+
+    Waiting writers block new readers so they are not starved. Both sides are reentrant and the writer can also
+    read, but a thread that reads can not upgrade to a writer, it gets a RuntimeError instead of a deadlock.
+    """
+
+    __slots__ = (
+        "condition",
+        "readers",
+        "writer",
+        "writer_depth",
+        "waiting_writers",
+        "local",
+    )
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition(threading.Lock())
+        self.readers: int = 0
+        self.writer: int | None = None
+        self.writer_depth: int = 0
+        self.waiting_writers: int = 0
+        self.local = threading.local()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(readers={self.readers!r}, writer={self.writer!r})"
+
+    def acquire_read(self) -> None:
+        depth: int = getattr(self.local, "depth", 0)
+        with self.condition:
+            if not depth and self.writer != threading.get_ident():
+                self.condition.wait_for(lambda: self.writer is None and not self.waiting_writers)
+            self.readers += 1
+        self.local.depth = depth + 1
+
+    def release_read(self) -> None:
+        with self.condition:
+            self.readers -= 1
+            self.local.depth -= 1
+            if not self.readers:
+                self.condition.notify_all()
+
+    def acquire_write(self) -> None:
+        ident = threading.get_ident()
+        with self.condition:
+            if self.writer == ident:
+                self.writer_depth += 1
+                return
+            if getattr(self.local, "depth", 0):
+                raise RuntimeError("A read lock can not be upgraded to a write lock")
+
+            self.waiting_writers += 1
+            try:
+                self.condition.wait_for(lambda: self.writer is None and not self.readers)
+            finally:
+                self.waiting_writers -= 1
+            self.writer, self.writer_depth = ident, 1
+
+    def release_write(self) -> None:
+        with self.condition:
+            self.writer_depth -= 1
+            if not self.writer_depth:
+                self.writer = None
+                self.condition.notify_all()
+
+    @contextlib.contextmanager
+    def read(self) -> typing.Iterator[None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextlib.contextmanager
+    def write(self) -> typing.Iterator[None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class FileLock:
+    """Shared and exclusive locks of processes on a lock file, with `fcntl.flock`.
+
+    Many processes can hold the shared lock while the exclusive lock is held by one of them alone. The lock is
+    reentrant in a process: the exclusive lock can be taken while the shared lock is held, and it goes back to
+    shared when it is released. A busy lock is retried with an exponential backoff until timeout seconds pass,
+    then LockTimeoutError is raised; timeout None waits forever.
+    """
+
+    __slots__ = (
+        "path",
+        "timeout",
+        "fd",
+        "pid",
+        "modes",
+        "mutex",
+    )
+
+    def __init__(self, path: str, *, timeout: float | None = 10.0) -> None:
+        if fcntl is None:
+            raise TypeError("Process locks are not supported yet on this platform!")
+
+        self.path = path
+        self.timeout = timeout
+        self.fd: int | None = None
+        self.pid: int | None = None
+        self.modes: list[bool] = []
+        self.mutex = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, timeout={self.timeout!r})"
+
+    @property
+    def depth(self) -> int:
+        return len(self.modes)
+
+    @property
+    def is_exclusive(self) -> bool:
+        return any(self.modes)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the lock file must be opened, in a forked child or after the file is removed by someone else."""
+        if self.fd is None or self.pid != os.getpid():
+            return True
+        try:
+            return os.stat(self.path).st_ino != os.fstat(self.fd).st_ino
+        except OSError:
+            return True
+
+    def acquire(self, *, exclusive: bool) -> None:
+        with self.mutex:
+            if self.modes and (not exclusive or self.is_exclusive):
+                self.modes.append(exclusive)
+                return
+
+            if not self.modes and self.is_stale:
+                if self.fd is not None:
+                    os.close(self.fd)
+                self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                self.pid = os.getpid()
+
+            try:
+                self._flock(fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            except LockTimeoutError:
+                if self.modes:  # NOTE: a failed upgrade may have dropped the shared lock, take it back
+                    fcntl.flock(self.fd, fcntl.LOCK_SH)
+                raise
+            self.modes.append(exclusive)
+
+    def release(self) -> None:
+        with self.mutex:
+            exclusive = self.modes.pop()
+            if not self.modes:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            elif exclusive and not self.is_exclusive:
+                fcntl.flock(self.fd, fcntl.LOCK_SH)
+
+    def close(self) -> None:
+        with self.mutex:
+            if self.fd is not None and self.pid == os.getpid():
+                os.close(self.fd)
+            self.fd = self.pid = None
+            self.modes.clear()
+
+    @contextlib.contextmanager
+    def shared(self) -> typing.Iterator[None]:
+        self.acquire(exclusive=False)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextlib.contextmanager
+    def exclusive(self) -> typing.Iterator[None]:
+        self.acquire(exclusive=True)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _flock(self, operation: int) -> None:
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        delay = MIN_DELAY
+        while True:
+            try:
+                fcntl.flock(self.fd, operation | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if deadline is not None and (remaining := deadline - time.monotonic()) <= 0:
+                    raise LockTimeoutError(f"Could not lock {self.path} in {self.timeout} seconds")
+
+            time.sleep(delay if deadline is None else min(delay, remaining))
+            delay = min(delay * 2, MAX_DELAY)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import operator
+import typing
+
+from pydbm import contstant as C
+from pydbm.exceptions import InvalidLookupError
+
+__all__ = (
+    "LOOKUP_SEPARATOR",
+    "LOOKUPS",
+    "PredicateT",
+    "compile_lookups",
+    "split_lookup",
+)
+
+LOOKUP_SEPARATOR: str = "__"
+LOOKUPS: dict[str, typing.Callable[[typing.Any, typing.Any], bool]] = {
+    "exact": operator.eq,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda value, arg: value in arg,
+    "range": lambda value, arg: arg[0] <= value <= arg[1],
+    "contains": lambda value, arg: arg in value,
+    "startswith": lambda value, arg: value.startswith(arg),
+    "endswith": lambda value, arg: value.endswith(arg),
+    "isnull": lambda value, arg: (value is None) is arg,
+}
+
+PredicateT = typing.Callable[[str, typing.Dict[str, typing.Any]], bool]
+
+
+def split_lookup(key: str) -> tuple[str, str]:
+    """Split a filter keyword like `age__gt` into its field name and lookup name."""
+    field_name, _, lookup = key.partition(LOOKUP_SEPARATOR)
+    return field_name, lookup or "exact"
+
+
+def compile_lookups(kwargs: dict[str, typing.Any], field_names: typing.Collection[str]) -> PredicateT:
+    """Compile filter keywords once into a predicate of the id and the decoded fields of a record."""
+    conditions: list[tuple[str, typing.Callable[[typing.Any, typing.Any], bool], typing.Any]] = []
+    for key, arg in kwargs.items():
+        field_name, lookup = split_lookup(key)
+        if field_name not in field_names:
+            raise InvalidLookupError(f"{field_name} is not a field, it can not be used in {key}")
+        if lookup not in LOOKUPS:
+            raise InvalidLookupError(f"{lookup} is not a supported lookup, use one of {', '.join(LOOKUPS)}")
+        if lookup == "in":
+            try:
+                arg = frozenset(arg)
+            except TypeError:
+                arg = tuple(arg)
+
+        conditions.append((field_name, LOOKUPS[lookup], arg))
+
+    def predicate(id: str, fields: dict[str, typing.Any]) -> bool:
+        try:
+            for field_name, lookup, arg in conditions:
+                value = id if field_name == C.PRIMARY_KEY else fields.get(field_name, None)
+                if not lookup(value, arg):
+                    return False
+        except TypeError:  # NOTE: the value can not be compared with arg, e.g. None > 1
+            return False
+        return True
+
+    return predicate
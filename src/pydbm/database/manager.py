@@ -1,15 +1,35 @@
 from __future__ import annotations
 
-import ast
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
 import datetime
-import dbm
+import functools
+import itertools
+import os
+import threading
+import time
 import typing
 from pathlib import Path
 
 from pydbm import contstant as C
-from pydbm.database.data_types import BaseDataType
+from pydbm.database.cache import CacheInfo, RecordCache
+from pydbm.database.compression import CompressionInfo
+from pydbm.database.engines import BaseEngine, iter_keys
+from pydbm.database.hooks import Hooks, HookT
+from pydbm.database.index import SecondaryIndex
+from pydbm.database.lazy import LazyModel
+from pydbm.database.locks import FileLock, RWLock
+from pydbm.database.lookups import compile_lookups, split_lookup
+from pydbm.database.parallel import parallel_filter
+from pydbm.database.serializers import BaseSerializer, BinarySerializer
+from pydbm.database.shards import ShardedDatabase, open_shards
+from pydbm.database.snapshot import write_snapshot
+from pydbm.database.stats import OperationStats, StatsCollector
+from pydbm.exceptions import UnnecessaryParamsError
 from pydbm.inspect_extra import get_obj_annotations
-from pydbm.models.fields import AutoField
+from pydbm.models.fields import AutoField, Undefined
 
 if typing.TYPE_CHECKING:
     from pydbm import DbmModel
@@ -19,14 +39,21 @@ if typing.TYPE_CHECKING:
 __all__ = (
     "DATABASE_EXTENSION",
     "DATABASE_HEADER_MAPPING",
+    "DATABASE_COUNT_NAME",
     "DATABASE_HEADER_NAME",
     "DATABASE_PATH",
+    "DATABASE_RESERVED_NAMES",
     "DatabaseManager",
+    "close_all",
+    "iter_keys",
 )
 
 Self = typing.TypeVar("Self", bound="DatabaseManager")  # unexport: not-public
+T = typing.TypeVar("T")  # unexport: not-public
 
 DATABASE_HEADER_NAME: str = "__database_headers__"
+DATABASE_COUNT_NAME: str = "__database_count__"
+DATABASE_RESERVED_NAMES: frozenset[str] = frozenset({DATABASE_HEADER_NAME, DATABASE_COUNT_NAME})
 DATABASE_HEADER_MAPPING: dict[SupportedClassT, str] = {
     bool: "bool",
     bytes: "bytes",
@@ -40,6 +67,15 @@ DATABASE_HEADER_MAPPING: dict[SupportedClassT, str] = {
 DATABASE_EXTENSION: str = "pydbm"
 DATABASE_PATH: Path = Path("pydbm")  # TODO: take from env
 
+_open_managers: set[DatabaseManager] = set()  # unexport: not-public
+
+
+@atexit.register
+def close_all() -> None:
+    """Close every database handle that is still open, it runs at interpreter exit."""
+    for manager in list(_open_managers):
+        manager.close()
+
 
 class DatabaseManager:
     if typing.TYPE_CHECKING:
@@ -49,31 +85,67 @@ class DatabaseManager:
         "model",
         "table_name",
         "db_path",
+        "db_paths",
         "db",
+        "engine",
+        "serializer",
+        "indexes",
+        "cache",
+        "lock",
+        "file_lock",
+        "collector",
+        "hooks",
         DATABASE_HEADER_NAME,
-        "_keys",
+        "_batch",
+        "_session_depth",
+        "_executor",
+        "_handle_lock",
+        "_flag",
+        "_writes",
         "__is_db_open",
     )
 
-    def __init__(self, *, model: typing.Type[DbmModel], table_name: str) -> None:  # TODO: table_name -> db_name
+    def __init__(self, *, model: typing.Type[DbmModel], table_name: str, indexes: tuple[str, ...] = ()) -> None:  # TODO: table_name -> db_name  # noqa: E501
         self.model = model
         self.table_name = table_name
 
         self.__is_db_open: bool = False
+        self._session_depth: int = 0
+        self._batch: dict[str, dict[str, typing.Any] | None] | None = None
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._handle_lock = threading.Lock()
+        self.lock: RWLock | None = RWLock() if self.model._config.thread_safe else None
+        self._flag: str = "c"
+        self._writes: int = 0
+        self.collector = StatsCollector()
+        self.hooks = Hooks(table_name)
         Path(DATABASE_PATH).mkdir(parents=True, exist_ok=True)
         self.db_path = (DATABASE_PATH / f"{self.table_name}.{DATABASE_EXTENSION}").as_posix()
-
+        self.db_paths = self.get_db_paths(self.model._config.shards)
+        self.engine: BaseEngine = BaseEngine.get_engine(self.model._config.engine)()
+        self.file_lock: FileLock | None = None
+        if self.model._config.process_lock:
+            if not self.engine.multiprocess:  # NOTE: the log and memory engines keep their state in the process
+                raise TypeError(f"Process locks are not supported yet with the {self.engine.name} engine!")
+            self.file_lock = FileLock(f"{self.db_path}.lock", timeout=self.model._config.lock_timeout)
+
+        self.indexes: dict[str, SecondaryIndex] = {}
+        self.cache: RecordCache | None = None
+        if self.model._config.cache_size:
+            self.cache = RecordCache(self.model._config.cache_size, self.model._config.cache_ttl)
         self.set_database_header()
+        self.set_indexes(indexes)
 
     def __enter__(self, *args, **kwargs):
         return self.open()
 
     def __exit__(self, *args, **kwargs):
-        self.close()
+        if not self.is_persistent:
+            self._close()
 
     def __len__(self) -> int:
-        with self as db:
-            return len(db) - 1  # NOTE: subtract 1 for the database header
+        with self._reading(), self as db:
+            return self._get_count(db)
 
     def __getitem__(self, id: str) -> DbmModel:
         return self.get(id=id)
@@ -85,63 +157,140 @@ class DatabaseManager:
         self.delete(id=id)
 
     def __contains__(self, id: str) -> bool:
-        with self as db:
-            return id in db
-
-    def __iter__(self: Self) -> Self:
-        with self as db:
-            # TODO: take key one by one to improve performance
-            self._keys: typing.Iterator[bytes] = iter(db.keys())
-        return self
-
-    def __next__(self) -> str:
-        _key: bytes | None = next(self._keys, None)
-        if _key is not None:
-            key: str = _key.decode("utf-8")
-            if key == DATABASE_HEADER_NAME:
-                return next(self)
-            return key
-        else:
-            del self._keys
-            raise StopIteration
+        with self._reading():
+            if self._batch is not None and id in self._batch:
+                return self._batch[id] is not None
+
+            with self as db:
+                return id in db
+
+    def __iter__(self) -> typing.Iterator[str]:
+        with self._scanning(), self.session() as objects:
+            for _key in self._iter_keys(objects.open()):
+                key: str = _key.decode("utf-8")
+                if key not in DATABASE_RESERVED_NAMES:
+                    yield key
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model!r}, table_name={self.table_name!r})"
 
     def set_database_header(self):
         ann = get_obj_annotations(obj=self.model)
-        db_headers = bytes(str({key: DATABASE_HEADER_MAPPING[value] for key, value in ann.items()}), "utf-8")
+        setattr(self, DATABASE_HEADER_NAME, ann)
+        db_headers = self.database_header
 
-        with self as db:
+        with self._writing(), self as db:
             database_header: bytes | None
             if (database_header := db.get(DATABASE_HEADER_NAME, None)) is None:
                 db[DATABASE_HEADER_NAME] = db_headers
+                db[DATABASE_COUNT_NAME] = b"0"
 
         if database_header is not None:
             # TODO: migrations
             assert database_header == db_headers, f"Database headers are not equal: '{database_header}' != '{db_headers}'"  # type: ignore[str-bytes-safe]  # noqa: E501
 
-        setattr(self, DATABASE_HEADER_NAME, ann)
+        self.serializer: BaseSerializer = BaseSerializer.get_serializer(self.model._config.serializer)(
+            ann,
+            compression=self.model._config.compression,
+            compression_threshold=self.model._config.compression_threshold,
+            readable=self.model._config.readable_serializers,
+        )
+
+    def set_indexes(self, indexes: tuple[str, ...]) -> None:
+        for field_name in indexes:
+            self.indexes[field_name] = SecondaryIndex(
+                field_name=field_name,
+                field_type=self.__database_headers__[field_name],
+                db_path=(DATABASE_PATH / f"{self.table_name}.{field_name}.index.{DATABASE_EXTENSION}").as_posix(),
+                engine=self.engine,
+            )
+            if self.file_lock is not None:  # NOTE: the readers open the index read only, it must exist
+                with self._writing():
+                    self.indexes[field_name].open()
+                    self.indexes[field_name].close()
+            if self.lock is not None:
+                self.indexes[field_name].open()
+
+    def get_db_paths(self, shards: int) -> tuple[str, ...]:
+        """Return the paths of the database files of the table when it is split into shards, see `Config.shards`."""
+        if shards < 1:
+            raise ValueError("shards must be greater than 0")
+        if shards == 1:
+            return (self.db_path,)
+        return tuple(
+            (DATABASE_PATH / f"{self.table_name}.shard{shard}of{shards}.{DATABASE_EXTENSION}").as_posix()
+            for shard in range(shards)
+        )
+
+    @property
+    def database_header(self) -> bytes:
+        """The field names and types of the table as they are stored in the database."""
+        return bytes(str({key: DATABASE_HEADER_MAPPING[value] for key, value in self.__database_headers__.items()}), "utf-8")  # noqa: E501
+
+    @property
+    def engine_name(self) -> str:
+        """The storage backend in use, e.g. "dbm.gnu" or "sqlite3", see `Config.engine`."""
+        return self.engine.backend(self.db_paths[0])
+
+    @property
+    def is_persistent(self) -> bool:
+        """Whether the handle must stay open after an operation, see `Config.keep_open` and `session`."""
+        return self.model._config.keep_open or self.lock is not None or self._session_depth > 0
 
     def open(self):
         if not self.__is_db_open:
-            self.db = dbm.open(self.db_path, "c")
-            self.__is_db_open = True
+            with self._handle_lock:
+                if not self.__is_db_open:
+                    start = time.perf_counter() if StatsCollector.enabled else None
+                    # NOTE: a handle opened under the shared process lock is read only, see `_locked`
+                    shared = self.file_lock is not None and self.file_lock.depth and not self.file_lock.is_exclusive
+                    self._flag = "r" if shared else "c"
+                    self.db = open_shards(self.engine, self.db_paths, self._flag, broadcast=DATABASE_RESERVED_NAMES)
+                    for index in self.indexes.values():
+                        index.flag = self._flag
+                    if self.lock is not None:  # NOTE: readers must not race to open the indexes lazily
+                        for index in self.indexes.values():
+                            index.open()
+                    self.__is_db_open = True
+                    _open_managers.add(self)
+                    if start is not None:
+                        self.collector.record("open", time.perf_counter() - start)
         return self.db
 
     def close(self) -> None:
-        if self.__is_db_open:
-            self.db.close()
-            self.__is_db_open = False
+        with self._writing():
+            self._close()
+
+    def flush(self) -> None:
+        with self._writing():
+            if self.__is_db_open and hasattr(self.db, "sync"):  # NOTE: dbm.ndbm has no sync
+                self.db.sync()
+            for index in self.indexes.values():
+                index.flush()
+
+    @contextlib.contextmanager
+    def session(self: Self) -> typing.Iterator[Self]:
+        """Keep a single handle open for every operation run inside the block."""
+        self._session_depth += 1
+        try:
+            if self.file_lock is None:  # NOTE: with the process lock, every operation opens the handle under the lock
+                self.open()
+            yield self
+        finally:
+            self._session_depth -= 1
+            if not self.is_persistent:
+                self._close()
 
     def save(self, *, id: str, fields: dict[str, typing.Any]) -> None:
-        data: dict[str, typing.Any] = {
-            key: BaseDataType.get_data_type(self.__database_headers__[key]).set(value) for key, value in fields.items()
-        }
-        data_for_dbm = bytes(str(data), "utf-8")
+        with self._writing():
+            if self._batch is not None:
+                self._batch[id] = dict(fields)
+                return
 
-        with self as db:
-            db[id] = data_for_dbm
+            data_for_dbm = self._encode(fields)
+
+            with self as db:
+                self._put(db, id, fields, data_for_dbm)
 
     def create(self, **kwargs) -> DbmModel:
         if not kwargs:
@@ -152,6 +301,36 @@ class DatabaseManager:
 
         return model
 
+    def bulk_create(self, objs: typing.Iterable[DbmModel | dict[str, typing.Any]], *, batch_size: int = 1000) -> list[str]:  # noqa: E501
+        """Validate, encode and write the objs batch by batch through a single handle, return the created ids.
+
+        Only one batch is kept in memory, so objs can be a generator; if an object of a batch is not valid,
+        none of that batch is written but the former batches are already saved. Inside `batch()` the objects are
+        buffered with the other writes of the block.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+
+        ids: list[str] = []
+        objs = iter(objs)
+        with self.session() if self._batch is None else contextlib.nullcontext(self) as objects:
+            while batch := list(itertools.islice(objs, batch_size)):
+                models = [
+                    obj if isinstance(obj, self.model) else self.model(**typing.cast(dict, obj)) for obj in batch
+                ]
+
+                with self._writing():
+                    if self._batch is not None:
+                        for model in models:
+                            self._batch[model.id] = dict(model.fields)
+                    else:
+                        records = [(model.id, model.fields, self._encode(model.fields)) for model in models]
+                        with objects as db:
+                            for id, fields, data_for_dbm in records:
+                                self._put(db, id, fields, data_for_dbm)
+                ids.extend(model.id for model in models)
+        return ids
+
     def get(self, *, id: str | None = None, **unique_together) -> DbmModel:
         if id is None:
             if self.model._config.unique_together != tuple(unique_together.keys()):
@@ -167,44 +346,174 @@ class DatabaseManager:
             )
             id = auto_field(fields=unique_together).get_default_value()
 
-        with self as db:
-            data_from_dbm: bytes = db.get(id, None)
-
-        if data_from_dbm is not None:
-            to_python = ast.literal_eval(data_from_dbm.decode("utf-8"))  # TODO: implement own parser
-            fields: dict[str, typing.Any] = {}
-            for key, value in to_python.items():
-                fields[key] = BaseDataType.get_data_type(self.__database_headers__[key]).get(value)
-
-            return self.model(**fields)
+        start = self.hooks.pre("get", id) if "get" in self.hooks.callbacks else None
+        model, size = self._lookup(id)
+        if start is not None:
+            self.hooks.post("get", id, start, size)
+        if model is not None:
+            return model
 
         if id is None:
             raise self.model.DoesNotExists(f"{self.model.__name__} with {unique_together} does not exists")
         else:
             raise self.model.DoesNotExists(f"{self.model.__name__} with id {id} does not exists")
 
+    def get_many(self, ids: typing.Iterable[str], *, strict: bool = False) -> dict[str, DbmModel]:
+        """Look up all ids through a single handle, missing ids are skipped unless strict is True."""
+        models: dict[str, DbmModel] = {}
+        with self._reading(), self as db:
+            for id in ids:
+                if self._batch is not None and id in self._batch:
+                    if (fields := self._batch[id]) is not None:
+                        models[id] = self._build(id, dict(fields))
+                    elif strict:
+                        raise self.model.DoesNotExists(f"{self.model.__name__} with id {id} does not exists")
+                    continue
+
+                if self.cache is not None and (fields := self.cache.get(id)) is not None:
+                    models[id] = self._build(id, fields)
+                    continue
+
+                data_from_dbm: bytes | None = self._read(db, id)
+                if data_from_dbm is not None:
+                    models[id] = self._to_model(id, data_from_dbm)
+                elif strict:
+                    raise self.model.DoesNotExists(f"{self.model.__name__} with id {id} does not exists")
+        return models
+
+    in_bulk = get_many
+
     def update(self, *, id: str, **updated_fields) -> None:
-        model = self.get(id=id)
-        fields = model.fields
+        with self._writing():
+            model = self.get(id=id)
+            fields = model.fields
 
-        for key, value in updated_fields.items():
-            fields[key] = value
+            for key, value in updated_fields.items():
+                fields[key] = value
 
-        self.save(id=id, fields=fields)
+            self.save(id=id, fields=fields)
 
     def delete(self, *, id: str) -> None:
-        with self as db:
-            del db[id]
+        with self._writing():
+            if self._batch is not None:
+                if id not in self:
+                    raise KeyError(id)
+                self._batch[id] = None
+                return
 
-    def all(self) -> typing.Iterable[DbmModel]:
-        for key in self:
-            yield self.get(id=key)
-
-    def filter(self, **kwargs) -> typing.Iterator[DbmModel]:
-        def check(model: DbmModel) -> bool:
-            return all(model.fields[key] == value for key, value in kwargs.items())
-
-        yield from filter(check, self.all())
+            with self as db:
+                self._remove(db, id)
+
+    @contextlib.contextmanager
+    def batch(self: Self) -> typing.Iterator[Self]:
+        """Buffer save and delete calls in memory and write them through a single handle when the block exits.
+
+        Repeated writes of an id are collapsed into the last one, get, get_many and exists by id read the buffered
+        writes back; scans see the database as it was before the block. Nothing is written if the block raises.
+        With `Config.thread_safe`, the block holds the write lock, so the other threads wait for it to end.
+        """
+        with self._writing():
+            if self._batch is not None:  # NOTE: nested batches are flushed by the outermost one
+                yield self
+                return
+
+            self._batch = {}
+            try:
+                yield self
+            except BaseException:
+                self._batch = None
+                raise
+
+            pending, self._batch = self._batch, None
+            with self as db:
+                for id, fields in pending.items():
+                    if fields is not None:
+                        self._put(db, id, fields, self._encode(fields))
+                    elif id in db:
+                        self._remove(db, id)
+
+    def scan(self) -> typing.Iterator[tuple[str, bytes]]:
+        """Stream id and raw record pairs, a single handle is kept open for the life of the scan.
+
+        The handle is released when the scan is exhausted or the generator is closed; a save or delete in the
+        scan lists the remaining keys at once, as the cursor of dbm.gnu does not survive a reorganisation.
+        """
+        if StatsCollector.enabled:
+            return self.collector.timed_scan(self._scan())
+        return self._scan()
+
+    def _scan(self) -> typing.Iterator[tuple[str, bytes]]:
+        with self._scanning(), self.session() as objects:
+            for _key in self._iter_keys(objects.open()):
+                key: str = _key.decode("utf-8")
+                if key in DATABASE_RESERVED_NAMES:
+                    continue
+
+                with self._reading():
+                    if "scan" in self.hooks.callbacks:
+                        data_from_dbm: bytes | None = self._traced_read(objects.open(), _key, key)
+                    else:
+                        data_from_dbm = self._read(objects.open(), _key)
+                if data_from_dbm is not None:
+                    yield key, data_from_dbm
+
+    @typing.overload
+    def all(self, *, lazy: typing.Literal[False] = ...) -> typing.Iterator[DbmModel]:
+        ...
+
+    @typing.overload
+    def all(self, *, lazy: typing.Literal[True]) -> typing.Iterator[LazyModel]:
+        ...
+
+    def all(self, *, lazy: bool = False) -> typing.Iterator[DbmModel] | typing.Iterator[LazyModel]:
+        """Iterate all models, or with lazy=True rows that decode and build the model only when it is needed."""
+        if lazy:
+            return (LazyModel(manager=self, id=id, data=data_from_dbm) for id, data_from_dbm in self.scan())
+        return (self._build(id, self._decode(data_from_dbm)) for id, data_from_dbm in self.scan())
+
+    def filter(self, *, workers: int | None = None, **kwargs) -> typing.Iterator[DbmModel]:
+        """Iterate the models matching every lookup of kwargs, e.g. `age__gt=18` or `name__in=("ada", "alan")`.
+
+        The lookups are compiled once and run on the decoded fields, so only the matching records build a model.
+        With workers greater than 1, the records are decoded and filtered by that many processes and the models
+        come in the order the partitions complete; engines that can not be shared between processes, and queries
+        answered by an index, are run in the process.
+        """
+        predicate = compile_lookups(kwargs, self.__database_headers__)
+        start = self.hooks.pre("filter", None) if "filter" in self.hooks.callbacks else None
+        try:
+            if workers is not None and workers > 1 and self.engine.multiprocess and not self._uses_indexes(kwargs):
+                for id, fields in self._parallel_filter(kwargs, workers):
+                    yield self._build(id, fields)
+                return
+
+            for id, data_from_dbm in self._candidates(kwargs):
+                fields = self._decode(data_from_dbm)
+                if predicate(id, fields):
+                    yield self._build(id, fields)
+        finally:
+            if start is not None:
+                self.hooks.post("filter", None, start)
+
+    def values(self, *field_names: str) -> typing.Iterator[dict[str, typing.Any]]:
+        """Stream dictionaries of the given fields, or of all fields, without building models."""
+        field_names = self._check_field_names(field_names)
+        wanted = frozenset(field_names)
+        for id, data_from_dbm in self.scan():
+            fields = self._decode(data_from_dbm, wanted)
+            yield {key: id if key == C.PRIMARY_KEY else fields.get(key) for key in field_names}
+
+    def values_list(self, *field_names: str, flat: bool = False) -> typing.Iterator[typing.Any]:
+        """Stream tuples of the given fields, or single values with flat=True, without building models."""
+        if flat and len(field_names) != 1:
+            raise ValueError("flat is only valid when values_list is called with a single field")
+
+        field_names = self._check_field_names(field_names)
+        wanted = frozenset(field_names)
+        for id, data_from_dbm in self.scan():
+            fields = self._decode(data_from_dbm, wanted)
+            row = tuple(id if key == C.PRIMARY_KEY else fields.get(key) for key in field_names)
+            yield row[0] if flat else row
 
     def exists(self, **kwargs) -> bool:
         if (id := kwargs.pop(C.PRIMARY_KEY, None)) is None and self.model._config.unique_together == tuple(kwargs.keys()):  # noqa: E501
@@ -216,11 +525,468 @@ class DatabaseManager:
             id = auto_field(fields=kwargs).get_default_value()
 
         if id is not None:
-            with self as db:
-                data_from_dbm: bytes = db.get(id, None)
-            return data_from_dbm is not None
+            return id in self
+        elif kwargs and kwargs.keys() <= self.indexes.keys() and (ids := self._lookup_indexes(kwargs)) is not None:
+            return bool(ids)
         else:
             return not (next(self.filter(**kwargs), False) is False)
 
-    def count(self):
+    def count(self) -> int:
         return len(self)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit, miss and eviction counters of the record cache, see `Config.cache_size`."""
+        if self.cache is None:
+            return CacheInfo(0, 0, 0, 0, 0)
+        return self.cache.info()
+
+    def compression_info(self) -> CompressionInfo:
+        """Return how many records were compressed and their raw and stored sizes, see `Config.compression`."""
+        return self.serializer.compression_info()
+
+    def add_hook(self, operation: str, callback: HookT, *, stage: str = "post") -> None:
+        """Call callback with a `HookEvent` before (stage "pre") or after (stage "post") every operation.
+
+        The operations are "save" and "delete" for every record written or deleted, "get", "filter", and "scan" for
+        every record read by a scan, filter included. Async operations call the hooks on their worker thread.
+        """
+        self.hooks.add(operation, callback, stage=stage)
+
+    def remove_hook(self, operation: str, callback: HookT, *, stage: str = "post") -> None:
+        self.hooks.remove(operation, callback, stage=stage)
+
+    def stats(self) -> OperationStats:
+        """Return the operation counters and timings of the table with its cache and compression info.
+
+        The operations are only recorded while the stats are on, see `enable_stats`.
+        """
+        return self.collector.info(cache=self.cache_info(), compression=self.compression_info())
+
+    def stats_clear(self) -> None:
+        self.collector.clear()
+
+    def cache_clear(self) -> None:
+        if self.cache is not None:
+            self.cache.clear()
+
+    def recount(self) -> int:
+        """Count the records by walking every key and repair the stored record counter."""
+        self._check_no_batch("recount")
+        with self._writing(), self as db:
+            return self._recount(db)
+
+    def rebuild_indexes(self) -> None:
+        """Build the secondary indexes from scratch, run it after adding Field(index=True) to an existing table."""
+        self._check_no_batch("rebuild_indexes")
+        with self._writing(), self.session():
+            for index in self.indexes.values():
+                index.clear()
+
+            for id, data_from_dbm in self.scan():
+                fields = self._decode(data_from_dbm)
+                for field_name, index in self.indexes.items():
+                    if field_name in fields:
+                        index.add(fields[field_name], id)
+
+    def reshard(self, shards: int) -> int:
+        """Copy the records stored in the given number of shards into the shards of `Config.shards`, return the count.
+
+        Run it once, while nothing else uses the table, after `Config.shards` is changed. The records are streamed
+        one by one and copied without decoding them; the old database files are kept, remove them afterwards.
+        """
+        self._check_no_batch("reshard")
+        source_paths = self.get_db_paths(shards)
+        if source_paths == self.db_paths:
+            return len(self)
+
+        source = open_shards(self.engine, source_paths, "r")
+        try:
+            with self._writing(), self.session() as objects:
+                db = objects.open()
+                for key in iter_keys(source):
+                    if str(key, "utf-8") not in DATABASE_RESERVED_NAMES:
+                        db[key] = source[key]
+                self.cache_clear()
+                return self._recount(db)
+        finally:
+            source.close()
+
+    def export_snapshot(self, path: str | os.PathLike) -> int:
+        """Write every record to an immutable snapshot file for `SnapshotManager`, return the record count.
+
+        Records are written in the binary format, those of the other serializers are converted on the way;
+        buffered batch writes are not part of the snapshot.
+        """
+        binary = BinarySerializer(self.__database_headers__)
+        with self._reading(), self.session() as objects:
+            db = objects.open()
+            keys = sorted(key for key in iter_keys(db) if str(key, "utf-8") not in DATABASE_RESERVED_NAMES)
+            records = (
+                data if data[0] == binary.format_version else binary.encode(self._decode(data))
+                for data in (db[key] for key in keys)
+            )
+            return write_snapshot(path, header=self.database_header, keys=keys, records=records)
+
+    async def aget(self, *, id: str | None = None, **unique_together) -> DbmModel:
+        return await self._run(self.get, id=id, **unique_together)
+
+    async def asave(self, *, id: str, fields: dict[str, typing.Any]) -> None:
+        await self._run(self.save, id=id, fields=fields)
+
+    async def acreate(self, **kwargs) -> DbmModel:
+        return await self._run(self.create, **kwargs)
+
+    async def aupdate(self, *, id: str, **updated_fields) -> None:
+        await self._run(self.update, id=id, **updated_fields)
+
+    async def adelete(self, *, id: str) -> None:
+        await self._run(self.delete, id=id)
+
+    async def aexists(self, **kwargs) -> bool:
+        return await self._run(self.exists, **kwargs)
+
+    async def acount(self) -> int:
+        return await self._run(self.count)
+
+    async def aall(self, *, chunk_size: int = 100) -> typing.AsyncIterator[DbmModel]:
+        """Iterate all models without blocking the event loop, chunk_size models are read per executor call."""
+        async for model in self._aiterate(self.all(), chunk_size):
+            yield model
+
+    async def afilter(self, *, chunk_size: int = 100, **kwargs) -> typing.AsyncIterator[DbmModel]:
+        """Iterate the models matching kwargs without blocking the event loop, see `filter`."""
+        async for model in self._aiterate(self.filter(**kwargs), chunk_size):
+            yield model
+
+    async def aclose(self) -> None:
+        """Close the handle held by the async API and stop its worker thread."""
+        if (executor := self._executor) is not None:
+            self._executor = None
+            await asyncio.get_running_loop().run_in_executor(executor, self._release)
+            executor.shutdown(wait=False)
+
+    def _run(self, function: typing.Callable[..., T], *args, **kwargs) -> asyncio.Future[T]:
+        """Run function on the single worker thread of the table, it keeps one handle open until `aclose`.
+
+        Every table has its own worker, so the operations of a table run one at a time and in order while
+        independent tables run concurrently.
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"pydbm-{self.table_name}"
+            )
+            self._session_depth += 1
+        return asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(function, *args, **kwargs))  # noqa: E501
+
+    def _release(self) -> None:
+        self._session_depth -= 1
+        if not self.is_persistent:
+            self._close()
+
+    async def _aiterate(self, iterator: typing.Iterator[T], chunk_size: int) -> typing.AsyncIterator[T]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+
+        chunk: list[T]
+        try:
+            while chunk := await self._run(list, itertools.islice(iterator, chunk_size)):
+                for item in chunk:
+                    yield item
+        finally:
+            await self._run(iterator.close)  # type: ignore[attr-defined]
+
+    def _reading(self) -> typing.ContextManager[None]:
+        """Hold the shared side of the locks of `Config.thread_safe` and `Config.process_lock`."""
+        if self.lock is None and self.file_lock is None:
+            return contextlib.nullcontext()
+        return self._locked(exclusive=False)
+
+    def _writing(self) -> typing.ContextManager[None]:
+        """Hold the exclusive side of the locks of `Config.thread_safe` and `Config.process_lock`."""
+        if self.lock is None and self.file_lock is None:
+            return contextlib.nullcontext()
+        return self._locked(exclusive=True)
+
+    def _scanning(self) -> typing.ContextManager[None]:
+        """Hold the shared process lock for a whole scan, the thread lock is only held per record by `_reading`."""
+        if self.file_lock is None:
+            return contextlib.nullcontext()
+        return self._locked(exclusive=False, threads=False)
+
+    @contextlib.contextmanager
+    def _locked(self, *, exclusive: bool, threads: bool = True) -> typing.Iterator[None]:
+        with contextlib.ExitStack() as stack:
+            if threads and self.lock is not None:
+                stack.enter_context(self.lock.write() if exclusive else self.lock.read())
+            if self.file_lock is None:
+                yield
+                return
+
+            upgrade = exclusive and self.file_lock.depth and not self.file_lock.is_exclusive
+            stack.enter_context(self.file_lock.exclusive() if exclusive else self.file_lock.shared())
+            if upgrade and self._flag == "r":  # NOTE: the read only handle is opened again for writing
+                self._close()
+            try:
+                yield
+            finally:
+                if self.file_lock.depth == 1:  # NOTE: the other processes can change the files once it is released
+                    self._close()
+
+    def _close(self) -> None:
+        if self.__is_db_open:
+            start = time.perf_counter() if StatsCollector.enabled else None
+            self.db.close()
+            for index in self.indexes.values():
+                index.close()
+            self.__is_db_open = False
+            _open_managers.discard(self)
+            if start is not None:
+                self.collector.record("close", time.perf_counter() - start)
+
+    def _iter_keys(self, db) -> typing.Iterator[bytes]:
+        """Stream the keys with iter_keys, or take them at once under the lock when the table can change in the scan.
+
+        With `Config.thread_safe` other threads can write between two records, and a write moves the cursor of
+        dbm.gnu; with `Config.process_lock` a write in the scan opens the handle again. Without them, a write of
+        the caller in the scan, counted by `_writes`, stops the cursor and the keys not yielded yet are listed.
+        """
+        if self.lock is None and self.file_lock is None:
+            writes, seen = self._writes, set()
+            for key in iter_keys(db):
+                seen.add(key)
+                yield key
+                if self._writes != writes:
+                    yield from [key for key in list(iter_keys(db)) if key not in seen]
+                    return
+            return
+
+        with self._reading():
+            keys = list(iter_keys(db))
+        yield from keys
+
+    def _put(self, db, id: str, fields: dict[str, typing.Any], data_for_dbm: bytes) -> None:
+        self._writes += 1
+        start = time.perf_counter() if StatsCollector.enabled else None
+        traced = self.hooks.pre("save", id, len(data_for_dbm)) if "save" in self.hooks.callbacks else None
+        if isinstance(db, ShardedDatabase):  # NOTE: the record and the counter of its shard are written together
+            db = db.shard(id)
+
+        if self.indexes:
+            old_data: bytes | None = db.get(id, None)
+            is_new = old_data is None
+            old_fields = self._decode(old_data) if old_data is not None else {}
+            for field_name, index in self.indexes.items():
+                old_value = old_fields.get(field_name, Undefined)
+                new_value = fields.get(field_name, Undefined)
+                if old_value == new_value:
+                    continue
+                if old_value is not Undefined:
+                    index.discard(old_value, id)
+                if new_value is not Undefined:
+                    index.add(new_value, id)
+        else:
+            is_new = id not in db
+
+        if is_new:
+            count = self._get_count(db)
+            db[id] = data_for_dbm
+            db[DATABASE_COUNT_NAME] = bytes(str(count + 1), "ascii")
+        else:
+            db[id] = data_for_dbm
+
+        if self.cache is not None:
+            self.cache.set(id, fields)
+
+        if start is not None:
+            self.collector.record("write", time.perf_counter() - start, len(data_for_dbm))
+        if traced is not None:
+            self.hooks.post("save", id, traced, len(data_for_dbm))
+
+    def _remove(self, db, id: str) -> None:
+        self._writes += 1
+        start = time.perf_counter() if StatsCollector.enabled else None
+        traced = self.hooks.pre("delete", id) if "delete" in self.hooks.callbacks else None
+        if isinstance(db, ShardedDatabase):
+            db = db.shard(id)
+
+        if self.indexes and (old_data := db.get(id, None)) is not None:
+            old_fields = self._decode(old_data)
+            for field_name, index in self.indexes.items():
+                if field_name in old_fields:
+                    index.discard(old_fields[field_name], id)
+
+        if self.cache is not None:
+            self.cache.discard(id)
+
+        count = self._get_count(db)
+        del db[id]
+        db[DATABASE_COUNT_NAME] = bytes(str(count - 1), "ascii")
+
+        if start is not None:
+            self.collector.record("delete", time.perf_counter() - start)
+        if traced is not None:
+            self.hooks.post("delete", id, traced)
+
+    def _get_count(self, db) -> int:
+        if isinstance(db, ShardedDatabase):
+            return sum(self._get_count(shard) for shard in db.shards)
+        if (count := db.get(DATABASE_COUNT_NAME, None)) is None:  # NOTE: tables created by older versions
+            if self._flag == "r":  # NOTE: a handle opened under the shared process lock can not repair the counter
+                return self._walk_count(db)
+            return self._recount(db)
+        return int(count)
+
+    def _recount(self, db) -> int:
+        if isinstance(db, ShardedDatabase):
+            return sum(self._recount(shard) for shard in db.shards)
+        count = self._walk_count(db)
+        db[DATABASE_COUNT_NAME] = bytes(str(count), "ascii")
+        return count
+
+    @staticmethod
+    def _walk_count(db) -> int:
+        return sum(1 for key in iter_keys(db) if str(key, "utf-8") not in DATABASE_RESERVED_NAMES)
+
+    def _lookup_indexes(self, kwargs: dict[str, typing.Any]) -> set[str] | None:
+        """Return the ids matching the indexed exact and in lookups of kwargs, or None when no index can be used."""
+        lookups: list[tuple[SecondaryIndex, list[typing.Any]]] = []
+        for key, value in kwargs.items():
+            field_name, lookup = split_lookup(key)
+            if field_name not in self.indexes or lookup not in ("exact", "in"):
+                continue
+
+            values = [value] if lookup == "exact" else list(value)
+            if all(self.indexes[field_name].supports(value) for value in values):
+                lookups.append((self.indexes[field_name], values))
+
+        if not lookups:
+            return None
+
+        with self._reading(), self:
+            ids: set[str] = set.intersection(
+                *(set().union(*(index.get(value) for value in values)) for index, values in lookups)
+            )
+        return ids
+
+    def _uses_indexes(self, kwargs: dict[str, typing.Any]) -> bool:
+        return any(
+            field_name in self.indexes and lookup in ("exact", "in")
+            for field_name, lookup in map(split_lookup, kwargs)
+        )
+
+    def _parallel_filter(self, kwargs: dict[str, typing.Any], workers: int) -> typing.Iterator[tuple[str, dict[str, typing.Any]]]:  # noqa: E501
+        self.flush()  # NOTE: the workers open the database files, they must hold every write
+        with self._scanning():
+            with self._reading(), self as db:
+                keys = [key for key in iter_keys(db) if str(key, "utf-8") not in DATABASE_RESERVED_NAMES]
+
+            # NOTE: dbm.gnu can not be opened for reading by the workers while a handle here has it open for writing,
+            # a persistent handle is closed and the next operation opens it again
+            with self.lock.write() if self.lock is not None else contextlib.nullcontext():
+                self._close()
+
+            yield from parallel_filter(
+                engine=type(self.engine),
+                db_paths=self.db_paths,
+                serializer=type(self.serializer),
+                readable=self.model._config.readable_serializers,
+                headers=self.__database_headers__,
+                kwargs=kwargs,
+                keys=keys,
+                workers=workers,
+            )
+
+    def _candidates(self, kwargs: dict[str, typing.Any]) -> typing.Iterator[tuple[str, bytes]]:
+        """Stream the id and raw record pairs that may match kwargs, from the indexes when possible."""
+        if (ids := self._lookup_indexes(kwargs)) is None:
+            yield from self.scan()
+            return
+
+        with self._scanning(), self.session() as objects:
+            for id in sorted(ids):
+                with self._reading():
+                    if "scan" in self.hooks.callbacks:
+                        data_from_dbm: bytes | None = self._traced_read(objects.open(), id, id)
+                    else:
+                        data_from_dbm = self._read(objects.open(), id)
+                if data_from_dbm is not None:
+                    yield id, data_from_dbm
+
+    def _check_no_batch(self, operation: str) -> None:
+        """Raise for the operations that write around the buffer of `batch()`, its flush would be applied over them."""
+        if self._batch is not None:
+            raise RuntimeError(f"{operation} can not run inside batch()")
+
+    def _check_field_names(self, field_names: tuple[str, ...]) -> tuple[str, ...]:
+        for field_name in field_names:
+            if field_name not in self.__database_headers__:
+                raise UnnecessaryParamsError(f"{field_name} is not defined in {self.model.__name__}")
+        return field_names or tuple(self.__database_headers__)
+
+    def _lookup(self, id: str) -> tuple[DbmModel | None, int | None]:
+        """Return the model of id, or None if it does not exist, with the size of its record if it is read."""
+        with self._reading():
+            if self._batch is not None and id in self._batch:
+                if (fields := self._batch[id]) is not None:
+                    return self._build(id, dict(fields)), None
+            elif self.cache is not None and (fields := self.cache.get(id)) is not None:
+                return self._build(id, fields), None
+            else:
+                with self as db:
+                    data_from_dbm: bytes | None = self._read(db, id)
+
+                if data_from_dbm is not None:
+                    return self._to_model(id, data_from_dbm), len(data_from_dbm)
+        return None, None
+
+    def _traced_read(self, db, key: str | bytes, id: str) -> bytes | None:
+        """Read a record of a scan between the pre and post hooks of the scan step."""
+        start = self.hooks.pre("scan", id)
+        data_from_dbm = self._read(db, key)
+        self.hooks.post("scan", id, start, len(data_from_dbm) if data_from_dbm is not None else None)
+        return data_from_dbm
+
+    def _read(self, db, key: str | bytes) -> bytes | None:
+        if not StatsCollector.enabled:
+            return db.get(key, None)
+
+        start = time.perf_counter()
+        data_from_dbm: bytes | None = db.get(key, None)
+        self.collector.record("read", time.perf_counter() - start, len(data_from_dbm or b""))
+        return data_from_dbm
+
+    def _encode(self, fields: dict[str, typing.Any]) -> bytes:
+        if not StatsCollector.enabled:
+            return self.serializer.encode(fields)
+
+        start = time.perf_counter()
+        data_for_dbm = self.serializer.encode(fields)
+        self.collector.record("encode", time.perf_counter() - start)
+        return data_for_dbm
+
+    def _decode(self, data_from_dbm: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:  # noqa: E501
+        if not StatsCollector.enabled:
+            return self.serializer.decode(data_from_dbm, field_names)
+
+        start = time.perf_counter()
+        fields = self.serializer.decode(data_from_dbm, field_names)
+        self.collector.record("decode", time.perf_counter() - start)
+        return fields
+
+    def _to_model(self, id: str, data_from_dbm: bytes) -> DbmModel:
+        fields = self._decode(data_from_dbm)
+        if self.cache is not None:
+            self.cache.set(id, fields)
+        return self._build(id, fields)
+
+    def _build(self, id: str, fields: dict[str, typing.Any]) -> DbmModel:
+        """Build a model from the decoded fields, without running validators if `Config.validate_on_load` is False."""
+        start = time.perf_counter() if StatsCollector.enabled else None
+        if not self.model._config.validate_on_load and len(fields) == len(self.__database_headers__) - 1:
+            model = self.model.from_db(id, fields)
+        else:
+            model = self.model(**fields)
+
+        if start is not None:
+            self.collector.record("build", time.perf_counter() - start)
+        return model
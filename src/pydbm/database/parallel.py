@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+from pydbm.database.lookups import compile_lookups
+from pydbm.database.shards import open_shards
+
+if typing.TYPE_CHECKING:
+    from pydbm.database.engines import BaseEngine
+    from pydbm.database.serializers import BaseSerializer
+    from pydbm.typing_extra import SupportedClassT
+
+__all__ = (
+    "filter_partition",
+    "parallel_filter",
+)
+
+PARTITIONS_PER_WORKER: int = 4  # unexport: not-public
+
+
+def filter_partition(
+    engine: typing.Type[BaseEngine],
+    db_paths: tuple[str, ...],
+    serializer: typing.Type[BaseSerializer],
+    headers: dict[str, SupportedClassT],
+    kwargs: dict[str, typing.Any],
+    keys: list[bytes],
+    readable: tuple[str, ...] = (),
+) -> list[tuple[str, dict[str, typing.Any]]]:
+    """Decode and filter the records of keys in a worker process, return the id and fields of the matching ones."""
+    predicate = compile_lookups(kwargs, headers)
+    decoder = serializer(headers, readable=readable)
+    matches: list[tuple[str, dict[str, typing.Any]]] = []
+
+    db = open_shards(engine(), db_paths, "r")
+    try:
+        for key in keys:
+            data_from_dbm: bytes | None = db.get(key, None)
+            if data_from_dbm is None:
+                continue
+
+            id = str(key, "utf-8")
+            fields = decoder.decode(data_from_dbm)
+            if predicate(id, fields):
+                matches.append((id, fields))
+    finally:
+        db.close()
+    return matches
+
+
+def parallel_filter(
+    *,
+    engine: typing.Type[BaseEngine],
+    db_paths: tuple[str, ...],
+    serializer: typing.Type[BaseSerializer],
+    headers: dict[str, SupportedClassT],
+    kwargs: dict[str, typing.Any],
+    keys: list[bytes],
+    workers: int,
+    readable: tuple[str, ...] = (),
+) -> typing.Iterator[tuple[str, dict[str, typing.Any]]]:
+    """Split keys into partitions and filter them on a pool of worker processes.
+
+    Every worker opens the database read only, so only the matching records are sent back; they are yielded
+    partition by partition as the workers complete them, not in key order.
+    """
+    size = max(1, -(-len(keys) // (workers * PARTITIONS_PER_WORKER)))
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(
+                filter_partition, engine, db_paths, serializer, headers, kwargs, keys[start:start + size], readable
+            )
+            for start in range(0, len(keys), size)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,17 @@
+from pydbm.database.serializers.base import BaseSerializer
+from pydbm.database.serializers.types import (
+    BinarySerializer,
+    JsonSerializer,
+    MarshalSerializer,
+    PickleSerializer,
+    ReprSerializer,
+)
+
+__all__ = (
+    "BaseSerializer",
+    "BinarySerializer",
+    "JsonSerializer",
+    "MarshalSerializer",
+    "PickleSerializer",
+    "ReprSerializer",
+)
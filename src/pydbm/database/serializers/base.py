@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import abc
+import typing
+
+from pydbm.database.compression import BaseCompressor, CompressionInfo
+from pydbm.database.data_types import BaseDataType
+
+if typing.TYPE_CHECKING:
+    from pydbm.typing_extra import SupportedClassT
+
+__all__ = (
+    "BaseSerializer",
+)
+
+
+class BaseSerializer(abc.ABC):
+    """Turn the fields of a record into bytes and back.
+
+    Every serializer writes its format version as the first byte of a record. A table reads the records of its own
+    serializer and of the legacy repr format, the records of the serializers named in readable are only read
+    when they are listed there, so a pickle record is never loaded by a table that did not opt in to it. With a
+    compression, records of at least compression_threshold bytes are compressed when it makes them smaller,
+    see `BaseCompressor`.
+    """
+
+    serializers: dict[str, typing.Type[BaseSerializer]] = {}
+    format_versions: dict[int, typing.Type[BaseSerializer]] = {}
+
+    name: typing.ClassVar[str]
+    format_version: typing.ClassVar[int]
+    prefix: typing.ClassVar[bytes]
+    native_types: typing.ClassVar[frozenset[SupportedClassT]] = frozenset()
+    always_readable: typing.ClassVar[bool] = False
+
+    __slots__ = (
+        "headers",
+        "setters",
+        "getters",
+        "readers",
+        "readable",
+        "compressor",
+        "compression_threshold",
+        "records",
+        "compressed",
+        "raw_size",
+        "stored_size",
+    )
+
+    def __init__(
+        self,
+        headers: dict[str, SupportedClassT],
+        *,
+        compression: str | None = None,
+        compression_threshold: int = 256,
+        readable: typing.Collection[str] = (),
+    ) -> None:
+        self.headers = headers
+        self.compressor = BaseCompressor.get_compressor(compression) if compression is not None else None
+        self.compression_threshold = compression_threshold
+        self.records = self.compressed = self.raw_size = self.stored_size = 0
+        self.setters: dict[str, typing.Callable[[typing.Any], typing.Any]] = {}
+        self.getters: dict[str, typing.Callable[[typing.Any], typing.Any]] = {}
+        for key, value in headers.items():
+            if value not in self.native_types:
+                data_type = BaseDataType.get_data_type(value)
+                self.setters[key], self.getters[key] = data_type.set, data_type.get
+
+        self.readers: dict[int, BaseSerializer] = {self.format_version: self}
+        self.readable: frozenset[int] = frozenset(
+            {self.format_version}
+            | {serializer.format_version for serializer in self.format_versions.values() if serializer.always_readable}
+            | {self.get_serializer(name).format_version for name in readable}
+        )
+
+    def __init_subclass__(cls, name: str, format_version: int, **kwargs):  # noqa
+        super().__init_subclass__(**kwargs)
+        cls.name = name
+        cls.format_version = format_version
+        cls.prefix = bytes((format_version,))
+        cls.serializers[name] = cls
+        cls.format_versions[format_version] = cls
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(headers={self.headers!r})"
+
+    @classmethod
+    def get_serializer(cls, name: str) -> typing.Type[BaseSerializer]:
+        try:
+            return cls.serializers[name]
+        except KeyError:
+            raise TypeError(f"Serializer {name} is not supported yet!")
+
+    @abc.abstractmethod
+    def dumps(self, fields: dict[str, typing.Any]) -> bytes:
+        pass
+
+    @abc.abstractmethod
+    def loads(self, data: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:
+        """Decode a record, only the fields in field_names are converted when it is given."""
+
+    def encode(self, fields: dict[str, typing.Any]) -> bytes:
+        data = self.dumps(fields)
+        if self.compressor is None:
+            return data
+
+        raw_size = len(data)
+        if raw_size >= self.compression_threshold:
+            compressed = self.compressor.prefix + self.compressor.compress(data)
+            if len(compressed) < raw_size:
+                data = compressed
+                self.compressed += 1
+
+        self.records += 1
+        self.raw_size += raw_size
+        self.stored_size += len(data)
+        return data
+
+    def decode(self, data: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:
+        """Decode a record with the serializer that wrote it, after the compressor that wrote it if any."""
+        try:
+            reader = self.readers[data[0]]
+        except KeyError:
+            if (compressor := BaseCompressor.flags.get(data[0], None)) is not None:
+                return self.decode(compressor.decompress(data[1:]), field_names)
+            try:
+                serializer = self.format_versions[data[0]]
+            except KeyError:
+                raise ValueError(f"Unknown record format version: {data[0]}")
+            if data[0] not in self.readable:
+                raise ValueError(f"Records of the {serializer.name} serializer are not readable by this table, see `Config.readable_serializers`")  # noqa: E501
+            reader = self.readers[data[0]] = serializer(self.headers)
+        return reader.loads(data, field_names)
+
+    def compression_info(self) -> CompressionInfo:
+        """Return the counters of the records encoded by this serializer since it was created."""
+        return CompressionInfo(self.records, self.compressed, self.raw_size, self.stored_size)
+
+    def to_primitive(self, fields: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        setters = self.setters
+        return {key: setters[key](value) if key in setters else value for key, value in fields.items()}
+
+    def from_primitive(
+        self, data: dict[str, typing.Any], field_names: typing.Collection[str] | None = None
+    ) -> dict[str, typing.Any]:
+        getters = self.getters
+        if field_names is not None:
+            data = {key: data[key] for key in field_names if key in data}
+        return {key: getters[key](value) if key in getters else value for key, value in data.items()}
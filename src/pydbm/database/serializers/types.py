@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import ast
+import datetime
+import json
+import marshal
+import pickle
+import struct
+import typing
+
+from pydbm.database.data_types import BaseDataType
+from pydbm.database.serializers.base import BaseSerializer
+
+if typing.TYPE_CHECKING:
+    from pydbm.typing_extra import SupportedClassT
+
+__all__ = (
+    "BinarySerializer",
+    "JsonSerializer",
+    "MarshalSerializer",
+    "PickleSerializer",
+    "ReprSerializer",
+)
+
+ABSENT: int = -1  # unexport: not-public
+
+
+class ReprSerializer(BaseSerializer, name="repr", format_version=ord("{")):
+    """The `str(dict)` format of the first releases, its records have no version byte, they start with "{"."""
+
+    always_readable = True
+
+    def dumps(self, fields: dict[str, typing.Any]) -> bytes:
+        return bytes(str(self.to_primitive(fields)), "utf-8")
+
+    def loads(self, data: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:
+        return self.from_primitive(ast.literal_eval(str(data, "utf-8")), field_names)
+
+
+class BinarySerializer(BaseSerializer, name="binary", format_version=1):
+    """Binary record format, driven by the field order of the database headers.
+
+    A record is a version byte, the signed length of every field in header order and then the values
+    one after another; no field name is stored and a missing field has the length -1.
+    """
+
+    __slots__ = (
+        "lengths",
+        "encoders",
+        "decoders",
+    )
+
+    def __init__(self, headers: dict[str, SupportedClassT], **kwargs) -> None:
+        super().__init__(headers, **kwargs)
+        self.lengths = struct.Struct(f">B{len(headers)}i")
+        self.encoders: dict[str, typing.Callable[[typing.Any], bytes]] = {
+            key: BaseDataType.get_data_type(value).to_bytes for key, value in headers.items()
+        }
+        self.decoders: tuple[tuple[str, typing.Callable[[bytes], typing.Any]], ...] = tuple(
+            (key, BaseDataType.get_data_type(value).from_bytes) for key, value in headers.items()
+        )
+
+    def dumps(self, fields: dict[str, typing.Any]) -> bytes:
+        lengths: list[int] = []
+        values: list[bytes] = []
+        for key, encoder in self.encoders.items():
+            if key in fields:
+                value = encoder(fields[key])
+                lengths.append(len(value))
+                values.append(value)
+            else:
+                lengths.append(ABSENT)
+        return self.lengths.pack(self.format_version, *lengths) + b"".join(values)
+
+    def loads(self, data: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:
+        version, *lengths = self.lengths.unpack_from(data)
+        offset = self.lengths.size
+        fields: dict[str, typing.Any] = {}
+        for (key, decoder), length in zip(self.decoders, lengths):
+            if length != ABSENT:
+                if field_names is None or key in field_names:
+                    fields[key] = decoder(data[offset:offset + length])
+                offset += length
+        return fields
+
+
+class JsonSerializer(BaseSerializer, name="json", format_version=2):
+    native_types = frozenset({bool, float, int, None, str})
+
+    def dumps(self, fields: dict[str, typing.Any]) -> bytes:
+        return self.prefix + bytes(json.dumps(self.to_primitive(fields), separators=(",", ":")), "utf-8")
+
+    def loads(self, data: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:
+        return self.from_primitive(json.loads(data[1:]), field_names)
+
+
+class MarshalSerializer(BaseSerializer, name="marshal", format_version=3):
+    native_types = frozenset({bool, bytes, float, int, None, str})
+
+    def dumps(self, fields: dict[str, typing.Any]) -> bytes:
+        return self.prefix + marshal.dumps(self.to_primitive(fields))
+
+    def loads(self, data: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:
+        return self.from_primitive(marshal.loads(data[1:]), field_names)
+
+
+class PickleSerializer(BaseSerializer, name="pickle", format_version=4):
+    """Only use it for data you trust, unpickling can run arbitrary code."""
+
+    native_types = frozenset({bool, bytes, datetime.date, datetime.datetime, float, int, None, str})
+
+    def dumps(self, fields: dict[str, typing.Any]) -> bytes:
+        return self.prefix + pickle.dumps(fields, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes, field_names: typing.Collection[str] | None = None) -> dict[str, typing.Any]:
+        fields = pickle.loads(data[1:])
+        if field_names is not None:
+            return {key: fields[key] for key in field_names if key in fields}
+        return fields
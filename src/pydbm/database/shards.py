@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import collections.abc
+import itertools
+import typing
+import zlib
+
+from pydbm.database.engines.base import iter_keys
+from pydbm.database.engines.types import KeyT, to_bytes
+
+if typing.TYPE_CHECKING:
+    from pydbm.database.engines import BaseEngine
+
+__all__ = (
+    "ShardedDatabase",
+    "open_shards",
+    "shard_of",
+)
+
+
+def shard_of(key: KeyT, shards: int) -> int:
+    """Return the shard of key, crc32 is stable across processes and Python versions unlike hash()."""
+    return zlib.crc32(to_bytes(key)) % shards
+
+
+def open_shards(engine: BaseEngine, paths: typing.Sequence[str], flag: str = "c", *, broadcast: typing.Collection[str] = ()):  # noqa: E501
+    """Open the database at paths, a single path is opened as it is and many paths as a `ShardedDatabase`."""
+    if len(paths) == 1:
+        return engine.open(paths[0], flag)
+    return ShardedDatabase.open(engine, paths, flag, broadcast=broadcast)
+
+
+class ShardedDatabase(collections.abc.MutableMapping):
+    """A handle that routes every key to one of many database handles by `shard_of`.
+
+    The broadcast keys, the database headers, are written to every shard and read from the first one;
+    iterating and len fan out across all shards.
+    """
+
+    __slots__ = (
+        "shards",
+        "broadcast",
+    )
+
+    def __init__(self, shards: list, *, broadcast: typing.Collection[str] = ()) -> None:
+        self.shards = shards
+        self.broadcast = frozenset(bytes(key, "utf-8") for key in broadcast)
+
+    @classmethod
+    def open(cls, engine: BaseEngine, paths: typing.Sequence[str], flag: str = "c", *, broadcast: typing.Collection[str] = ()) -> ShardedDatabase:  # noqa: E501
+        shards: list = []
+        try:
+            for path in paths:
+                shards.append(engine.open(path, flag))
+        except BaseException:
+            for shard in shards:
+                shard.close()
+            raise
+        return cls(shards, broadcast=broadcast)
+
+    def __getitem__(self, key: KeyT) -> bytes:
+        return self.shard(key)[key]
+
+    def __setitem__(self, key: KeyT, value: KeyT) -> None:
+        if to_bytes(key) in self.broadcast:
+            for shard in self.shards:
+                shard[key] = value
+        else:
+            self.shard(key)[key] = value
+
+    def __delitem__(self, key: KeyT) -> None:
+        if to_bytes(key) in self.broadcast:
+            for shard in self.shards:
+                del shard[key]
+        else:
+            del self.shard(key)[key]
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.shard(key)  # type: ignore[arg-type]
+
+    def shard(self, key: KeyT):
+        """Return the handle of the shard that holds key."""
+        if to_bytes(key) in self.broadcast:
+            return self.shards[0]
+        return self.shards[shard_of(key, len(self.shards))]
+
+    def keys(self) -> typing.Iterator[bytes]:  # type: ignore[override]
+        """Stream the keys shard by shard, a broadcast key is only taken from the first shard."""
+        first, *others = self.shards
+        return itertools.chain(
+            iter_keys(first),
+            *((key for key in iter_keys(shard) if key not in self.broadcast) for shard in others),
+        )
+
+    def sync(self) -> None:
+        for shard in self.shards:
+            if hasattr(shard, "sync"):
+                shard.sync()
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
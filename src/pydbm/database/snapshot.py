@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import typing
+
+from pydbm import contstant as C
+from pydbm.database.lookups import compile_lookups
+from pydbm.database.serializers import BinarySerializer
+from pydbm.models.fields import AutoField
+
+if typing.TYPE_CHECKING:
+    from pydbm import DbmModel
+
+__all__ = (
+    "SnapshotManager",
+    "write_snapshot",
+)
+
+SNAPSHOT_MAGIC: bytes = b"PYDBMSNP"  # unexport: not-public
+SNAPSHOT_VERSION: int = 1  # unexport: not-public
+SNAPSHOT_HEADER = struct.Struct(">8sBQI")  # unexport: not-public
+SNAPSHOT_ENTRY = struct.Struct(">QIQI")  # unexport: not-public
+
+
+def write_snapshot(path: str | os.PathLike, *, header: bytes, keys: list[bytes], records: typing.Iterable[bytes]) -> int:  # noqa: E501
+    """Write an immutable snapshot file of the sorted keys and their binary records, return the record count.
+
+    The file is a fixed size header, the database header, a table of key and record offsets in key order,
+    the keys and then the records; it is written next to path and renamed, so a reader never sees half a file.
+    """
+    path = os.fspath(path)
+    tmp_path = path + ".tmp"
+    entries_offset = SNAPSHOT_HEADER.size + len(header)
+    offset = keys_offset = entries_offset + SNAPSHOT_ENTRY.size * len(keys)
+    key_offsets: list[int] = []
+    for key in keys:
+        key_offsets.append(offset)
+        offset += len(key)
+
+    entries: list[bytes] = []
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(keys), len(header)) + header)
+            file.seek(keys_offset)
+            file.write(b"".join(keys))
+            for key, key_offset, record in zip(keys, key_offsets, records):
+                entries.append(SNAPSHOT_ENTRY.pack(key_offset, len(key), offset, len(record)))
+                file.write(record)
+                offset += len(record)
+
+            if len(entries) != len(keys):
+                raise ValueError(f"Snapshot has {len(keys)} keys but {len(entries)} records")
+
+            file.seek(entries_offset)
+            file.write(b"".join(entries))
+            file.flush()
+            os.fsync(file.fileno())
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return len(keys)
+
+
+class SnapshotManager:
+    """Serve the reads of a table from a snapshot file written by `DatabaseManager.export_snapshot`.
+
+    The file is mapped into memory read-only, ids are found with a binary search over the sorted key table and
+    records are decoded straight from the mapping; processes that open the same file share its page cache.
+    """
+
+    __slots__ = (
+        "model",
+        "path",
+        "serializer",
+        "mm",
+        "buffer",
+        "size",
+        "entries_offset",
+    )
+
+    def __init__(self, *, model: typing.Type[DbmModel], path: str | os.PathLike) -> None:
+        self.model = model
+        self.path = os.fspath(path)
+
+        with open(self.path, "rb") as file:
+            self.mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.mm)
+
+        try:
+            magic, version, self.size, header_length = SNAPSHOT_HEADER.unpack_from(self.mm)
+        except struct.error:
+            magic = version = None
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a pydbm snapshot")
+
+        self.entries_offset = SNAPSHOT_HEADER.size + header_length
+        header = self.mm[SNAPSHOT_HEADER.size:self.entries_offset]
+        if header != model.objects.database_header:
+            self.close()
+            raise ValueError(f"Snapshot headers are not equal: '{header}' != '{model.objects.database_header}'")  # type: ignore[str-bytes-safe]  # noqa: E501
+
+        self.serializer = BinarySerializer(model.objects.__database_headers__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, id: str) -> bool:
+        return self._find(id) is not None
+
+    def __iter__(self) -> typing.Iterator[str]:
+        for position in range(self.size):
+            yield str(self._key(position), "utf-8")
+
+    def __getitem__(self, id: str) -> DbmModel:
+        return self.get(id=id)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(model={self.model!r}, path={self.path!r})"
+
+    def close(self) -> None:
+        """Unmap the file, it raises BufferError while a record view of `scan` is still referenced."""
+        if not self.mm.closed:
+            self.buffer.release()
+            self.mm.close()
+
+    def get(self, *, id: str | None = None, **unique_together) -> DbmModel:
+        if id is None:
+            if self.model._config.unique_together != tuple(unique_together.keys()):
+                raise self.model.RiskofReturningMultipleObjects(
+                    "To get single data from database you must pass"
+                    f" all unique_together fields: {self.model._config.unique_together}"
+                )
+
+            auto_field = AutoField(
+                field_name=C.PRIMARY_KEY,
+                field_type=str,
+                unique_together=self.model._config.unique_together
+            )
+            id = auto_field(fields=unique_together).get_default_value()
+
+        if (position := self._find(id)) is None:
+            raise self.model.DoesNotExists(f"{self.model.__name__} with id {id} does not exists")
+        return self._build(id, self._decode(self._record(position)))
+
+    def scan(self) -> typing.Iterator[tuple[str, memoryview]]:
+        """Stream id and record pairs in id order, a record is a view of the mapping and is not copied."""
+        for position in range(self.size):
+            yield str(self._key(position), "utf-8"), self._record(position)
+
+    def all(self) -> typing.Iterator[DbmModel]:
+        return (self._build(id, self._decode(record)) for id, record in self.scan())
+
+    def filter(self, **kwargs) -> typing.Iterator[DbmModel]:
+        """Iterate the models matching every lookup of kwargs, an exact id lookup is a single binary search."""
+        predicate = compile_lookups(kwargs, self.model.objects.__database_headers__)
+        records: typing.Iterable[tuple[str, memoryview]]
+        if isinstance(id := kwargs.get(C.PRIMARY_KEY, None), str):
+            position = self._find(id)
+            records = () if position is None else ((id, self._record(position)),)
+        else:
+            records = self.scan()
+
+        for id, record in records:
+            fields = self._decode(record)
+            if predicate(id, fields):
+                yield self._build(id, fields)
+
+    def exists(self, **kwargs) -> bool:
+        return not (next(self.filter(**kwargs), False) is False)
+
+    def count(self) -> int:
+        return len(self)
+
+    def _entry(self, position: int) -> tuple[int, int, int, int]:
+        return SNAPSHOT_ENTRY.unpack_from(self.mm, self.entries_offset + position * SNAPSHOT_ENTRY.size)
+
+    def _key(self, position: int) -> bytes:
+        key_offset, key_length, _, _ = self._entry(position)
+        return self.mm[key_offset:key_offset + key_length]
+
+    def _record(self, position: int) -> memoryview:
+        _, _, record_offset, record_length = self._entry(position)
+        return self.buffer[record_offset:record_offset + record_length]
+
+    def _find(self, id: str) -> int | None:
+        key = bytes(id, "utf-8")
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.size and self._key(low) == key:
+            return low
+        return None
+
+    def _decode(self, record: memoryview) -> dict[str, typing.Any]:
+        # NOTE: the binary format is read with struct.unpack_from and slices, they take the view without a copy
+        return self.serializer.decode(typing.cast(bytes, record))
+
+    def _build(self, id: str, fields: dict[str, typing.Any]) -> DbmModel:
+        if not self.model._config.validate_on_load and len(fields) == len(self.serializer.headers) - 1:
+            return self.model.from_db(id, fields)
+        return self.model(**fields)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing
+
+from pydbm.database.cache import CacheInfo
+from pydbm.database.compression import CompressionInfo
+
+__all__ = (
+    "OPERATIONS",
+    "OperationStats",
+    "StatsCollector",
+    "disable_stats",
+    "enable_stats",
+    "stats_enabled",
+)
+
+T = typing.TypeVar("T")  # unexport: not-public
+
+OPERATIONS: tuple[str, ...] = ("open", "close", "read", "write", "delete", "scan", "encode", "decode", "build")
+
+
+class OperationStats(typing.NamedTuple):
+    """Counters and cumulative timings in seconds of a table since the stats were enabled or cleared.
+
+    reads, writes and deletes count records, scans count the scans started; scan_time is the time spent in
+    the scans, so it includes the reads of their records. builds is the number of models built from records.
+    """
+
+    opens: int
+    closes: int
+    reads: int
+    writes: int
+    deletes: int
+    scans: int
+    encodes: int
+    decodes: int
+    builds: int
+    open_time: float
+    close_time: float
+    read_time: float
+    write_time: float
+    delete_time: float
+    scan_time: float
+    encode_time: float
+    decode_time: float
+    build_time: float
+    bytes_read: int
+    bytes_written: int
+    cache: CacheInfo
+    compression: CompressionInfo
+
+
+class StatsCollector:
+    """Counters and timings of the operations of a table, they are only recorded while `enabled` is True.
+
+    The call sites check `StatsCollector.enabled` before reading the clock, so a disabled collector costs a
+    single attribute lookup per operation.
+    """
+
+    enabled: typing.ClassVar[bool] = False
+
+    __slots__ = (
+        "counts",
+        "times",
+        "bytes_read",
+        "bytes_written",
+        "lock",
+    )
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = dict.fromkeys(OPERATIONS, 0)
+        self.times: dict[str, float] = dict.fromkeys(OPERATIONS, 0.0)
+        self.bytes_read = self.bytes_written = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(counts={self.counts!r})"
+
+    def record(self, operation: str, elapsed: float, size: int = 0) -> None:
+        """Add an operation that took elapsed seconds, size is the bytes read or written by a read or a write."""
+        with self.lock:
+            self.counts[operation] += 1
+            self.times[operation] += elapsed
+            if operation == "read":
+                self.bytes_read += size
+            elif operation == "write":
+                self.bytes_written += size
+
+    def timed_scan(self, iterator: typing.Iterator[T]) -> typing.Iterator[T]:
+        """Count a scan and add the time spent in iterator, the time spent by the consumer between items is not."""
+        elapsed = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                yield item
+        finally:
+            iterator.close()  # type: ignore[attr-defined]
+            self.record("scan", elapsed)
+
+    def info(self, *, cache: CacheInfo, compression: CompressionInfo) -> OperationStats:
+        with self.lock:
+            return OperationStats(
+                opens=self.counts["open"],
+                closes=self.counts["close"],
+                reads=self.counts["read"],
+                writes=self.counts["write"],
+                deletes=self.counts["delete"],
+                scans=self.counts["scan"],
+                encodes=self.counts["encode"],
+                decodes=self.counts["decode"],
+                builds=self.counts["build"],
+                open_time=self.times["open"],
+                close_time=self.times["close"],
+                read_time=self.times["read"],
+                write_time=self.times["write"],
+                delete_time=self.times["delete"],
+                scan_time=self.times["scan"],
+                encode_time=self.times["encode"],
+                decode_time=self.times["decode"],
+                build_time=self.times["build"],
+                bytes_read=self.bytes_read,
+                bytes_written=self.bytes_written,
+                cache=cache,
+                compression=compression,
+            )
+
+    def clear(self) -> None:
+        with self.lock:
+            self.counts = dict.fromkeys(OPERATIONS, 0)
+            self.times = dict.fromkeys(OPERATIONS, 0.0)
+            self.bytes_read = self.bytes_written = 0
+
+
+def enable_stats() -> None:
+    """Start recording the operation stats of every table, see `DatabaseManager.stats`."""
+    StatsCollector.enabled = True
+
+
+def disable_stats() -> None:
+    """Stop recording the operation stats, the recorded ones are kept."""
+    StatsCollector.enabled = False
+
+
+def stats_enabled() -> bool:
+    return StatsCollector.enabled
@@ -7,6 +7,8 @@ __all__ = (
     "ValidationError",
     "EmptyModelError",
     "UnnecessaryParamsError",
+    "InvalidLookupError",
+    "LockTimeoutError",
 )
 
 
@@ -44,3 +46,15 @@ class UnnecessaryParamsError(PydbmBaseException, ValueError):
     """Exception for invalid params."""
 
     pass
+
+
+class InvalidLookupError(PydbmBaseException, ValueError):
+    """Exception for not valid filter lookup."""
+
+    pass
+
+
+class LockTimeoutError(PydbmBaseException, TimeoutError):
+    """Exception for a database lock that could not be taken in time."""
+
+    pass
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing
 
+from pydbm import contstant as C
 from pydbm.database import DatabaseManager
 from pydbm.models.meta import Meta
 
@@ -9,6 +10,8 @@ __all__ = (
     "DbmModel",
 )
 
+Self = typing.TypeVar("Self", bound="DbmModel")  # unexport: not-public
+
 
 class DbmModel(metaclass=Meta):
     if typing.TYPE_CHECKING:
@@ -43,6 +46,16 @@ class DbmModel(metaclass=Meta):
     def __len__(self):
         return self.objects.count()  # type: ignore
 
+    @classmethod
+    def from_db(cls: typing.Type[Self], id: str, fields: dict[str, typing.Any]) -> Self:
+        """Build an instance from trusted fields that are read from the database, validators are not run."""
+        model = cls.__new__(cls)
+        model.fields = fields
+        for key, value in fields.items():
+            setattr(model, "_" + key, value)
+        setattr(model, "_" + C.PRIMARY_KEY, id)
+        return model
+
     def save(self) -> None:
         self.objects.save(id=self.id, fields=self.fields)
 
@@ -38,6 +38,7 @@ class BaseField:
         "private_name",
         "max_value",
         "min_value",
+        "index",
         "kwargs",
         "_is_call_run",
     )
@@ -50,6 +51,7 @@ class BaseField:
         validators: list[ValidatorT] | None = None,
         max_value: int | None = None,
         min_value: int | None = None,
+        index: bool = False,
     ) -> None:  # noqa: E501
         assert not (
             default is not Undefined and default_factory is not Undefined
@@ -61,6 +63,7 @@ class BaseField:
         self.validators: list[ValidatorT] = [] if validators is None else validators
         self.max_value = max_value
         self.min_value = min_value
+        self.index = index
 
         self._is_call_run = False
 
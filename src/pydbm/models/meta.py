@@ -17,6 +17,19 @@ __all__ = (
 class Config(typing.NamedTuple):  # unexport: not-public
     table_name: str
     unique_together: tuple[str, ...]
+    keep_open: bool = False
+    serializer: str = "binary"
+    validate_on_load: bool = True
+    cache_size: int = 0
+    cache_ttl: typing.Optional[float] = None
+    engine: typing.Optional[str] = None
+    thread_safe: bool = False
+    process_lock: bool = False
+    lock_timeout: typing.Optional[float] = 10.0
+    shards: int = 1
+    compression: typing.Optional[str] = None
+    compression_threshold: int = 256
+    readable_serializers: tuple[str, ...] = ()
 
 
 @typing_extra.dataclass_transform(kw_only_default=True, field_specifiers=(Field,))
@@ -54,7 +67,11 @@ class Meta(type):
             fields = mcs.generate_fields(cls, cls_name, namespace)
 
             cls.required_fields, cls.not_required_fields = mcs.split_fields(list(fields.values()))
-            cls.objects = DatabaseManager(model=cls, table_name=cls._config.table_name)  # type: ignore
+            cls.objects = DatabaseManager(
+                model=cls,  # type: ignore
+                table_name=cls._config.table_name,
+                indexes=tuple(key for key, value in fields.items() if value.index),
+            )
             cls.DoesNotExists = type("DoesNotExists", (PydbmBaseException,), {"__doc__": "Exception for not found id in the models."})  # type: ignore # noqa: E501
             cls.RiskofReturningMultipleObjects = type("RiskofReturningMultipleObjects", (PydbmBaseException,), {"__doc__": "Exception for risk of returning multiple objects."})  # noqa: E501
 
@@ -84,19 +101,19 @@ class Meta(type):
     def get_config(mcs, cls, cls_name: str, namespace: dict[str, typing.Any]) -> Config:
         config: Config | None = namespace.get(C.CLASS_CONFIG_NAME, None)
 
+        options: dict[str, typing.Any] = {
+            "table_name": mcs.generate_table_name(cls_name),
+            "unique_together": C.UNIQUE_TOGETHER,
+        }
         if config is not None:
-            table_name = config.table_name if hasattr(config, "table_name") else mcs.generate_table_name(cls_name)
-            unique_together = config.unique_together if hasattr(config, "unique_together") else C.UNIQUE_TOGETHER
-        else:
-            table_name = mcs.generate_table_name(cls_name)
-            unique_together = C.UNIQUE_TOGETHER
+            options.update({name: getattr(config, name) for name in Config._fields if hasattr(config, name)})
 
-        if not unique_together:
+        if not options["unique_together"]:
             ann = get_obj_annotations(obj=cls)
             ann.pop(C.PRIMARY_KEY, None)  # NOTE: Remove primary key from unique_together
-            unique_together = tuple(ann.keys())
+            options["unique_together"] = tuple(ann.keys())
 
-        return Config(table_name, unique_together)
+        return Config(**options)
 
     @staticmethod
     def generate_table_name(cls_name: str) -> str:
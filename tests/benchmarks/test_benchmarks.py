@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from pydbm.benchmarks import OPERATIONS, format_json, format_table, percentile, run
+from pydbm.benchmarks.__main__ import main
+
+
+def test_percentile():
+    latencies = [float(i) for i in range(1, 101)]
+
+    assert percentile(latencies, 50) == 50.0
+    assert percentile(latencies, 99) == 99.0
+    assert percentile([1.0], 99) == 1.0
+    assert percentile([], 50) == 0.0
+
+
+def test_run(tmp_path):
+    results = run(
+        engines=["memory"],
+        sizes=[20],
+        widths=[1, 3],
+        field_types=["str", "bool", "date"],
+        samples=10,
+        repeat=2,
+        directory=str(tmp_path),
+    )
+
+    assert [(result.width, result.operation) for result in results] == [
+        (width, operation) for width in (1, 3) for operation in OPERATIONS
+    ]
+    assert {result.ops for result in results if result.operation == "save"} == {20}
+    assert {result.ops for result in results if result.operation in ("get", "exists")} == {10}
+    assert {result.ops for result in results if result.operation in ("count", "all", "filter")} == {2}
+    assert all(result.ops_per_sec > 0 and result.p50_ms <= result.p99_ms for result in results)
+
+    table = format_table(results).splitlines()
+    assert table[0].split()[:5] == ["engine", "size", "width", "field", "types"]
+    assert len(table) == len(results) + 2
+    assert json.loads(format_json(results))[0] == results[0]._asdict()
+
+
+def test_run_unknown_engine(tmp_path):
+    with pytest.raises(TypeError):
+        run(engines=["unknown"], sizes=[1], widths=[1], field_types=["int"], directory=str(tmp_path))
+
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / "results.json"
+    args = ["--engines", "memory", "--sizes", "5", "--samples", "3", "--repeat", "1", "--operations", "save", "get"]
+
+    assert main([*args, "--directory", str(tmp_path), "--json", str(path)]) == 0
+    assert [result["operation"] for result in json.loads(path.read_text())] == ["save", "get"]
+    assert "ops/sec" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        main(["--sizes", "0"])
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+from pydbm import DbmModel
+
+
+class AsyncModel(DbmModel):
+    name: str
+    age: int
+
+
+class OtherAsyncModel(DbmModel):
+    name: str
+
+
+def run(coroutine):
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            await AsyncModel.objects.aclose()
+            await OtherAsyncModel.objects.aclose()
+
+    return asyncio.run(main())
+
+
+def test_async_crud():
+    async def main():
+        ada = await AsyncModel.objects.acreate(name="ada", age=36)
+        assert await AsyncModel.objects.aget(id=ada.id) == ada
+        assert await AsyncModel.objects.aexists(name="ada") is True
+        assert await AsyncModel.objects.acount() == 1
+
+        await AsyncModel.objects.aupdate(id=ada.id, age=37)
+        assert (await AsyncModel.objects.aget(id=ada.id)).age == 37
+
+        await AsyncModel.objects.asave(id=ada.id, fields={"name": "ada", "age": 38})
+        assert (await AsyncModel.objects.aget(id=ada.id)).age == 38
+
+        await AsyncModel.objects.adelete(id=ada.id)
+        with pytest.raises(AsyncModel.DoesNotExists):
+            await AsyncModel.objects.aget(id=ada.id)
+
+    run(main())
+
+
+def test_async_iterators():
+    async def main():
+        await asyncio.gather(*(AsyncModel.objects.acreate(name=str(age), age=age) for age in range(5)))
+
+        assert sorted([model.age async for model in AsyncModel.objects.aall(chunk_size=2)]) == list(range(5))
+        assert sorted([model.age async for model in AsyncModel.objects.afilter(age__gte=3)]) == [3, 4]
+
+        with pytest.raises(ValueError):
+            [model async for model in AsyncModel.objects.aall(chunk_size=0)]
+
+    run(main())
+
+
+def test_async_runs_off_the_event_loop(monkeypatch):
+    threads = set()
+    get = AsyncModel.objects.get
+
+    def _get(*args, **kwargs):
+        threads.add(threading.current_thread())
+        return get(*args, **kwargs)
+
+    async def main():
+        model = await AsyncModel.objects.acreate(name="ada", age=36)
+        monkeypatch.setattr(AsyncModel.objects.__class__, "get", lambda self, **kwargs: _get(**kwargs))
+        await AsyncModel.objects.aget(id=model.id)
+        await OtherAsyncModel.objects.acreate(name="alan")
+
+        assert AsyncModel.objects._executor is not OtherAsyncModel.objects._executor
+        assert AsyncModel.objects.is_persistent is True
+
+    run(main())
+    assert threads and threading.main_thread() not in threads
+    assert AsyncModel.objects._executor is None
+    assert AsyncModel.objects.is_persistent is False
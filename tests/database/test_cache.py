@@ -0,0 +1,47 @@
+import pytest
+
+from pydbm.database.cache import CacheInfo, RecordCache
+
+
+def test_record_cache_lru():
+    cache = RecordCache(2)
+    cache.set("1", {"int": 1})
+    cache.set("2", {"int": 2})
+
+    assert cache.get("1") == {"int": 1}
+    cache.set("3", {"int": 3})
+
+    assert cache.get("2") is None
+    assert cache.get("3") == {"int": 3}
+    assert cache.info() == CacheInfo(hits=2, misses=1, evictions=1, maxsize=2, currsize=2)
+
+    cache.discard("1")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_record_cache_returns_copy():
+    cache = RecordCache(1)
+    cache.set("1", {"int": 1})
+    cache.get("1")["int"] = 2
+
+    assert cache.get("1") == {"int": 1}
+
+
+def test_record_cache_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    cache = RecordCache(1, ttl=10)
+    cache.set("1", {"int": 1})
+
+    now = 110.0
+    assert cache.get("1") == {"int": 1}
+    now = 110.1
+    assert cache.get("1") is None
+    assert len(cache) == 0
+
+
+def test_record_cache_maxsize():
+    with pytest.raises(ValueError):
+        RecordCache(0)
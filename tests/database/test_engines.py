@@ -0,0 +1,174 @@
+import dbm
+
+import pytest
+
+from pydbm import DbmModel, Field
+from pydbm.database.engines import BaseEngine, LogEngine, LogFile, MemoryEngine, SqliteDatabase, set_default_engine
+
+
+@pytest.fixture(scope="function", autouse=True)
+def teardown_engines():
+    yield
+    MemoryEngine.databases.clear()
+    LogEngine.close_all()
+
+
+def make_model(engine):
+    return type("EngineModel", (DbmModel,), {
+        "__annotations__": {"name": str, "age": int},
+        "age": Field(index=True),
+        "Config": type("Config", (), {"engine": engine}),
+    })
+
+
+@pytest.mark.parametrize(
+    "engine, backend",
+    [("dumb", "dbm.dumb"), ("log", "log"), ("memory", "memory"), ("sqlite", "sqlite3")],
+)
+def test_engine(engine, backend):
+    model = make_model(engine)
+    assert model.objects.engine_name == backend
+
+    ada = model.objects.create(name="ada", age=36)
+    model.objects.bulk_create([{"name": "alan", "age": 41}, {"name": "bob", "age": 20}])
+
+    assert model.objects.get(id=ada.id) == ada
+    assert model.objects.count() == 3
+    assert sorted(model.name for model in model.objects.all()) == ["ada", "alan", "bob"]
+    assert [model.name for model in model.objects.filter(age=41)] == ["alan"]
+    assert model.objects.exists(age=20)
+
+    model.objects.delete(id=ada.id)
+    assert ada.id not in model.objects
+    assert model.objects.recount() == 2
+
+    with model.objects as db:
+        assert db.get(ada.id) is None
+        with pytest.raises(KeyError):
+            del db[ada.id]
+
+
+def test_dbm_engine():
+    model = make_model(None)
+    assert model.objects.engine.name == "dbm"
+    assert model.objects.engine_name == dbm.whichdb(model.objects.db_path)
+
+
+def test_memory_engine_close():
+    db = MemoryEngine().open("memory", "c")
+    db["key"] = "value"
+    assert db[b"key"] == b"value"
+    db.close()
+
+    with pytest.raises(dbm.error):
+        db["key"]
+
+    assert MemoryEngine().open("memory", "r")["key"] == b"value"
+    assert "key" not in MemoryEngine().open("memory", "n")
+    with pytest.raises(dbm.error):
+        MemoryEngine().open("missing", "r")
+
+
+def test_sqlite_cursor(tmp_path):
+    db = SqliteDatabase((tmp_path / "test.sqlite").as_posix())
+    db.update({"b": b"2", "a": b"1"})
+
+    assert db.firstkey() == b"a"
+    assert db.nextkey(b"a") == b"b"
+    assert db.nextkey(b"b") is None
+    assert list(db) == [b"a", b"b"]
+    assert len(db) == 2
+    db.close()
+
+
+def test_get_engine_error():
+    with pytest.raises(TypeError) as cm:
+        BaseEngine.get_engine("unknown")
+    assert str(cm.value) == "Engine unknown is not supported yet!"
+
+
+def test_set_default_engine():
+    try:
+        set_default_engine("memory")
+        assert make_model(None).objects.engine_name == "memory"
+    finally:
+        set_default_engine("dbm")
+
+    with pytest.raises(TypeError):
+        set_default_engine("unknown")
+
+
+def test_log_engine_reopen(tmp_path):
+    path = (tmp_path / "test").as_posix()
+    db = LogEngine().open(path)
+    db["a"] = "1"
+    db["b"] = "2"
+    db["a"] = "3"
+    del db["b"]
+    db.close()
+
+    assert dict(LogEngine().open(path, "r")) == {b"a": b"3"}
+    with pytest.raises(dbm.error):
+        LogEngine().open(path, "r")["c"] = "4"
+
+    LogEngine.close_all()
+    assert (tmp_path / "test.log.hint").exists()
+    assert dict(LogEngine().open(path)) == {b"a": b"3"}
+
+    LogEngine.close_all()
+    (tmp_path / "test.log.hint").unlink()
+    assert dict(LogEngine().open(path)) == {b"a": b"3"}
+
+
+def test_log_engine_corrupted_tail(tmp_path):
+    path = (tmp_path / "test").as_posix()
+    db = LogEngine().open(path)
+    db["a"] = "1"
+    LogEngine.close_all()
+
+    (tmp_path / "test.log.hint").unlink()
+    with open(tmp_path / "test.log", "ab") as file:
+        file.write(b"\x00\x01")
+
+    db = LogEngine().open(path)
+    assert dict(db) == {b"a": b"1"}
+    db["b"] = "2"
+    LogEngine.close_all()
+    (tmp_path / "test.log.hint").unlink()
+    assert dict(LogEngine().open(path)) == {b"a": b"1", b"b": b"2"}
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_log_compaction(tmp_path, background):
+    log = LogFile((tmp_path / "test.log").as_posix())
+    for i in range(100):
+        log.put(b"key", bytes(str(i), "ascii"))
+    log.put(b"deleted", b"value")
+    log.put(b"deleted", None)
+    size = log.size
+
+    log.compact(background=background)
+    log.put(b"other", b"value")
+    log.wait()
+
+    assert log.size < size
+    assert log.garbage == 0 or background
+    assert log.get(b"key") == b"99"
+    assert log.get(b"deleted") is None
+    assert log.get(b"other") == b"value"
+    log.close()
+
+    log = LogFile((tmp_path / "test.log").as_posix())
+    assert set(log.index) == {b"key", b"other"}
+    log.close()
+
+
+def test_log_automatic_compaction(tmp_path):
+    log = LogFile((tmp_path / "test.log").as_posix(), compaction_min_size=1024)
+    for i in range(200):
+        log.put(b"key", b"x" * 64)
+    log.wait()
+
+    assert log.size < 1024
+    assert log.get(b"key") == b"x" * 64
+    log.close()
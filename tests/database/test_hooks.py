@@ -0,0 +1,73 @@
+import pytest
+
+from pydbm import DbmModel
+from pydbm.database import HookEvent
+from pydbm.database.hooks import Hooks
+
+
+class HookModel(DbmModel):
+    name: str
+    age: int
+
+
+@pytest.fixture(scope="function")
+def events():
+    events: list[HookEvent] = []
+    for operation in ("save", "get", "delete", "filter", "scan"):
+        for stage in ("pre", "post"):
+            HookModel.objects.add_hook(operation, events.append, stage=stage)
+    yield events
+    HookModel.objects.hooks.clear()
+
+
+def test_hooks():
+    hooks = Hooks("table")
+    hooks.add("get", print)
+    assert list(hooks.callbacks) == ["get"]
+
+    with pytest.raises(TypeError):
+        hooks.add("unknown", print)
+    with pytest.raises(ValueError):
+        hooks.add("get", print, stage="unknown")
+    with pytest.raises(ValueError):
+        hooks.remove("get", print, stage="pre")
+
+    hooks.remove("get", print)
+    assert hooks.callbacks == {}
+
+
+def test_manager_hooks(events):
+    objects = HookModel.objects
+    model = objects.create(name="ada", age=36)
+    objects.get(id=model.id)
+    assert [model.name for model in objects.filter(age=36)] == ["ada"]
+    objects.delete(id=model.id)
+    with pytest.raises(HookModel.DoesNotExists):
+        objects.get(id=model.id)
+
+    assert [(event.operation, event.stage) for event in events] == [
+        ("save", "pre"), ("save", "post"),
+        ("get", "pre"), ("get", "post"),
+        ("filter", "pre"), ("scan", "pre"), ("scan", "post"), ("filter", "post"),
+        ("delete", "pre"), ("delete", "post"),
+        ("get", "pre"), ("get", "post"),
+    ]
+    assert {event.table_name for event in events} == {"hookmodels"}
+    assert all(event.duration is None for event in events if event.stage == "pre")
+    assert all(event.duration >= 0 for event in events if event.stage == "post")
+
+    save, get, scan = events[1], events[3], events[6]
+    assert save.id == get.id == scan.id == model.id
+    assert save.size == get.size == scan.size > 0
+    assert (events[-1].id, events[-1].size) == (model.id, None)
+    assert events[7].id is None
+
+
+def test_remove_hook(events):
+    for operation in ("save", "get", "delete", "filter", "scan"):
+        for stage in ("pre", "post"):
+            HookModel.objects.remove_hook(operation, events.append, stage=stage)
+    assert HookModel.objects.hooks.callbacks == {}
+
+    HookModel.objects.create(name="ada", age=36)
+    assert list(HookModel.objects.all()) and events == []
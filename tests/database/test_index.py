@@ -0,0 +1,113 @@
+import pytest
+
+from pydbm import DbmModel, Field
+from pydbm.database import DatabaseManager
+
+
+@pytest.fixture(scope="function")
+def model():
+    class IndexModel(DbmModel):
+        name: str = Field(index=True)
+        age: int = Field(index=True)
+        city: str
+
+    return IndexModel
+
+
+def test_index_is_maintained(model):
+    ada = model.objects.create(name="ada", age=36, city="london")
+    alan = model.objects.create(name="alan", age=41, city="london")
+    index = model.objects.indexes["age"]
+
+    with model.objects:
+        assert index.get(36) == {ada.id}
+        assert index.get(41) == {alan.id}
+
+    model.objects.update(id=ada.id, age=37)
+    with model.objects:
+        assert index.get(36) == set()
+        assert index.get(37) == {ada.id}
+
+    model.objects.delete(id=alan.id)
+    with model.objects:
+        assert index.get(41) == set()
+        assert model.objects.indexes["name"].get("alan") == set()
+
+
+def test_filter_and_exists_use_index(model, monkeypatch):
+    ada = model.objects.create(name="ada", age=36, city="london")
+    model.objects.bulk_create([{"name": "alan", "age": 36, "city": "manchester"}])
+
+    monkeypatch.setattr(DatabaseManager, "scan", lambda self: pytest.fail("table must not be scanned"))
+    assert list(model.objects.filter(age=36, city="london")) == [ada]
+    assert len(list(model.objects.filter(age=36))) == 2
+    assert list(model.objects.filter(age=99)) == []
+    assert list(model.objects.filter(name__in=["ada", "bob"], age__exact=36)) == [ada]
+    assert model.objects.exists(name="ada", age=36)
+    assert not model.objects.exists(name="ada", age=41)
+
+
+def test_filter_falls_back_to_scan(model):
+    ada = model.objects.create(name="ada", age=36, city="london")
+
+    assert list(model.objects.filter(city="london")) == [ada]
+    assert list(model.objects.filter(age=36.0)) == [ada]
+
+
+def test_rebuild_indexes(model):
+    ada = model.objects.create(name="ada", age=36, city="london")
+    index = model.objects.indexes["name"]
+
+    with model.objects:
+        index.discard("ada", ada.id)
+        index.add("ghost", "missing")
+    model.objects.rebuild_indexes()
+
+    with model.objects:
+        assert index.get("ada") == {ada.id}
+        assert index.get("ghost") == set()
+
+
+def test_index_chunks(model, monkeypatch):
+    monkeypatch.setattr("pydbm.database.index.CHUNK_SIZE", 2)
+    index = model.objects.indexes["age"]
+    ids = [str(i) for i in range(5)]
+
+    with model.objects:
+        for id in ids:
+            index.add(36, id)
+        index.add(36, "0")
+        assert index.get(36) == set(ids)
+
+        index.discard(36, "1")
+        index.discard(36, "missing")
+        index.add(36, "5")
+        assert index.get(36) == {"0", "2", "3", "4", "5"}
+        assert index.get(41) == set()
+
+        for id in ("0", "2", "3", "4", "5"):
+            index.discard(36, id)
+        assert index.get(36) == set()
+        assert list(index.db.keys()) == []
+
+
+def test_index_chunks_churn(model, monkeypatch):
+    monkeypatch.setattr("pydbm.database.index.CHUNK_SIZE", 4)
+    index = model.objects.indexes["age"]
+    head_key = index._key(b"h", index.to_bytes(36))
+
+    with model.objects:
+        for id in range(10):
+            index.add(36, str(id))
+        for id in range(10, 1010):
+            index.discard(36, str(id - 10))
+            index.add(36, str(id))
+        assert index.db[head_key] == b"3,10"
+        assert index.get(36) == {str(id) for id in range(1000, 1010)}
+
+        for id in (1000, 1003, 1009, 1001, 1002, 1004):
+            index.discard(36, str(id))
+            index.add(36, str(id))
+            index.discard(36, str(id))
+        assert index.db[head_key] == b"1,4"
+        assert index.get(36) == {"1005", "1006", "1007", "1008"}
@@ -0,0 +1,41 @@
+import pytest
+
+from pydbm import DbmModel
+from pydbm.database.lazy import LazyModel
+
+
+class LazyTestModel(DbmModel):
+    name: str
+    age: int
+
+    def greet(self) -> str:
+        return f"Hello {self.name}"
+
+
+@pytest.fixture(scope="function")
+def ada():
+    return LazyTestModel.objects.create(name="ada", age=36)
+
+
+def test_lazy_all(ada, monkeypatch):
+    [row] = list(LazyTestModel.objects.all(lazy=True))
+
+    assert isinstance(row, LazyModel)
+    assert row.id == ada.id
+    assert row._fields is None and row._model is None
+
+    assert row.name == "ada"
+    assert row.age == 36
+    assert row._fields == {"name": "ada", "age": 36}
+    assert row._model is None
+
+    assert row.greet() == "Hello ada"
+    assert row.to_model() is row._model
+    assert row == ada
+    assert repr(row) == f"LazyModel(LazyTestModel, id={ada.id!r})"
+
+
+def test_lazy_missing_attribute(ada):
+    [row] = LazyTestModel.objects.all(lazy=True)
+    with pytest.raises(AttributeError):
+        row.missing
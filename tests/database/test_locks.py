@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from pydbm.database.locks import FileLock, RWLock
+from pydbm.exceptions import LockTimeoutError
+
+
+def test_readers_share_the_lock():
+    lock = RWLock()
+    entered = threading.Barrier(2, timeout=5)
+
+    def read():
+        with lock.read():
+            entered.wait()
+
+    threads = [threading.Thread(target=read) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert lock.readers == 0
+
+
+def test_writer_excludes_readers():
+    lock = RWLock()
+    events: list[str] = []
+
+    lock.acquire_write()
+    reader = threading.Thread(target=lambda: lock.read().__enter__() or events.append("read"))
+    reader.start()
+    reader.join(0.1)
+    assert events == []
+
+    events.append("write")
+    lock.release_write()
+    reader.join()
+    assert events == ["write", "read"]
+
+
+def test_reentrant():
+    lock = RWLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                assert lock.writer == threading.get_ident()
+        assert lock.writer_depth == 1
+
+    with lock.read():
+        with lock.read():
+            assert lock.readers == 2
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
+
+    assert (lock.readers, lock.writer) == (0, None)
+
+
+def test_file_lock(tmp_path):
+    path = str(tmp_path / "test.lock")
+    lock, other = FileLock(path), FileLock(path, timeout=0.05)
+
+    with lock.shared():
+        with other.shared():
+            assert (lock.depth, other.depth) == (1, 1)
+
+        with pytest.raises(LockTimeoutError):
+            other.acquire(exclusive=True)
+        assert other.depth == 0
+
+    with lock.exclusive():
+        with lock.shared():
+            assert lock.is_exclusive
+        with pytest.raises(LockTimeoutError):
+            other.acquire(exclusive=False)
+
+    with other.exclusive():
+        assert other.depth == 1
+    lock.close()
+    other.close()
+
+
+def test_file_lock_upgrade(tmp_path):
+    path = str(tmp_path / "test.lock")
+    lock, other = FileLock(path), FileLock(path, timeout=0.05)
+
+    with lock.shared():
+        with lock.exclusive():
+            assert lock.is_exclusive
+            with pytest.raises(LockTimeoutError):
+                other.acquire(exclusive=False)
+
+        assert not lock.is_exclusive
+        with other.shared():
+            pass
+    lock.close()
+    other.close()
@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+
+from pydbm.database.lookups import compile_lookups, split_lookup
+from pydbm.exceptions import InvalidLookupError
+
+FIELD_NAMES = ("id", "name", "age", "created", "nickname")
+FIELDS = {"name": "hakan", "age": 26, "created": datetime.date(2021, 1, 1), "nickname": None}
+
+
+def test_split_lookup():
+    assert split_lookup("age") == ("age", "exact")
+    assert split_lookup("age__gt") == ("age", "gt")
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"name": "hakan"}, True),
+        ({"name__exact": "celik"}, False),
+        ({"age__gt": 25, "age__lt": 27}, True),
+        ({"age__gte": 27}, False),
+        ({"age__lte": 26}, True),
+        ({"name__in": ["hakan", "celik"]}, True),
+        ({"name__in": [["unhashable"]]}, False),
+        ({"created__range": (datetime.date(2020, 1, 1), datetime.date(2022, 1, 1))}, True),
+        ({"name__contains": "ak"}, True),
+        ({"name__startswith": "ha"}, True),
+        ({"name__endswith": "ha"}, False),
+        ({"nickname__isnull": True}, True),
+        ({"name__isnull": True}, False),
+        ({"nickname__gt": 1}, False),
+        ({"id": "1"}, True),
+        ({"id__in": ["2"]}, False),
+        ({}, True),
+    ],
+)
+def test_compile_lookups(kwargs, expected):
+    assert compile_lookups(kwargs, FIELD_NAMES)("1", FIELDS) is expected
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_error_ms",
+    [
+        ({"surname": "celik"}, "surname is not a field, it can not be used in surname"),
+        ({"age__between": (1, 2)}, "between is not a supported lookup, use one of exact, gt, gte, lt, lte, in, range, contains, startswith, endswith, isnull"),  # noqa: E501
+    ],
+)
+def test_compile_lookups_error(kwargs, expected_error_ms):
+    with pytest.raises(InvalidLookupError) as cm:
+        compile_lookups(kwargs, FIELD_NAMES)
+    assert str(cm.value) == expected_error_ms
@@ -1,10 +1,15 @@
 import datetime
 import dbm
+import multiprocessing
+import threading
 
 import pytest
 
-from pydbm import DbmModel
+from pydbm import DbmModel, Field, ValidationError
 from pydbm.database import DatabaseManager
+from pydbm.database.locks import FileLock
+from pydbm.database.manager import close_all, iter_keys
+from pydbm.exceptions import LockTimeoutError, UnnecessaryParamsError
 
 
 @pytest.fixture(scope="function")
@@ -199,3 +204,539 @@ def test_multiple_database_open(minimum_manager):
     minimum_manager.open()
     minimum_manager.open()
     minimum_manager.close()
+
+
+def test_session_reuses_handle(minimum_manager):
+    with minimum_manager.session() as objects:
+        db = objects.open()
+        objects.save(id="1", fields={"str": "test"})
+        assert objects.get(id="1").str == "test"
+        assert len(objects) == 1
+        assert objects.open() is db
+
+    assert not minimum_manager.is_persistent
+    with pytest.raises(Exception):
+        db["test"] = b"test"
+
+
+def test_nested_session(minimum_manager):
+    with minimum_manager.session():
+        with minimum_manager.session():
+            db = minimum_manager.open()
+        assert minimum_manager.open() is db
+    assert minimum_manager.open() is not db
+    minimum_manager.close()
+
+
+def test_keep_open():
+    class KeepOpenModel(DbmModel):
+        str: str
+
+        class Config:
+            keep_open = True
+
+    objects = KeepOpenModel.objects
+    assert objects.is_persistent
+
+    db = objects.open()
+    KeepOpenModel(str="test").save()
+    objects.flush()
+    assert objects.count() == 1
+    assert objects.open() is db
+
+    close_all()
+    assert objects.open() is not db
+    objects.close()
+
+
+def test_get_legacy_record(minimum_manager):
+    with minimum_manager as db:
+        db["1"] = b"{'str': 'test'}"
+
+    assert minimum_manager.get(id="1").str == "test"
+
+
+@pytest.mark.parametrize("serializer", ["binary", "json", "marshal", "pickle", "repr"])
+def test_config_serializer(serializer):
+    SerializerModel = type("SerializerModel", (DbmModel,), {  # noqa: N806
+        "__annotations__": {"date": datetime.date, "int": int},
+        "Config": type("Config", (), {"serializer": serializer}),
+    })
+
+    assert SerializerModel.objects.serializer.name == serializer
+    model = SerializerModel.objects.create(date=datetime.date(2021, 1, 1), int=1)
+    assert SerializerModel.objects.get(id=model.id) == model
+
+
+def test_bulk_create():
+    class BulkCreateModel(DbmModel):
+        int: int
+
+    rows = ({"int": i} for i in range(10))
+    ids = BulkCreateModel.objects.bulk_create(rows, batch_size=3)
+
+    assert len(ids) == 10
+    assert len(BulkCreateModel.objects) == 10
+    assert sorted(BulkCreateModel.objects.get(id=id_).int for id_ in ids) == list(range(10))
+
+    model = BulkCreateModel(int=10)
+    assert BulkCreateModel.objects.bulk_create([model]) == [model.id]
+    assert len(BulkCreateModel.objects) == 11
+
+
+def test_bulk_create_invalid_batch():
+    class BulkCreateModel(DbmModel):
+        int: int
+
+    with pytest.raises(ValidationError):
+        BulkCreateModel.objects.bulk_create([{"int": 1}, {"int": 2}, {"int": "3"}], batch_size=2)
+    assert len(BulkCreateModel.objects) == 2
+
+    with pytest.raises(ValueError):
+        BulkCreateModel.objects.bulk_create([], batch_size=0)
+
+
+def test_get_many():
+    class GetManyModel(DbmModel):
+        int: int
+
+    ids = GetManyModel.objects.bulk_create({"int": i} for i in range(3))
+
+    models = GetManyModel.objects.get_many([*ids, "missing"])
+    assert list(models) == ids
+    assert [model.int for model in models.values()] == [0, 1, 2]
+
+    assert GetManyModel.objects.in_bulk(ids[:1]) == {ids[0]: GetManyModel(int=0)}
+
+    with pytest.raises(GetManyModel.DoesNotExists) as cm:
+        GetManyModel.objects.get_many([*ids, "missing"], strict=True)
+    assert str(cm.value) == "GetManyModel with id missing does not exists"
+
+
+def test_iter_keys_with_cursor():
+    class Cursor(dict):
+        def firstkey(self):
+            return next(iter(self), None)
+
+        def nextkey(self, key):
+            keys = list(self)
+            index = keys.index(key) + 1
+            return keys[index] if index < len(keys) else None
+
+        def keys(self):
+            raise AssertionError("keys() must not be called")
+
+    assert list(iter_keys(Cursor({b"a": b"1", b"b": b"2"}))) == [b"a", b"b"]
+    assert list(iter_keys(Cursor())) == []
+
+
+def test_scan_keeps_single_handle():
+    class ScanModel(DbmModel):
+        int: int
+
+    ScanModel.objects.bulk_create({"int": i} for i in range(3))
+
+    scan = ScanModel.objects.scan()
+    _, data = next(scan)
+    db = ScanModel.objects.open()
+    assert isinstance(data, bytes)
+    for _ in scan:
+        assert ScanModel.objects.open() is db
+    assert ScanModel.objects.open() is not db
+    ScanModel.objects.close()
+
+    assert sorted(model.int for model in ScanModel.objects.all()) == [0, 1, 2]
+    assert len(list(ScanModel.objects)) == 3
+
+
+def test_filter_lookups(monkeypatch):
+    class LookupModel(DbmModel):
+        name: str
+        age: int
+
+    LookupModel.objects.bulk_create({"name": name, "age": age} for name, age in (("ada", 36), ("alan", 41), ("bob", 20)))  # noqa: E501
+    built = []
+    monkeypatch.setattr(LookupModel, "__init__", lambda self, **fields: built.append(fields) or DbmModel.__init__(self, **fields))  # noqa: E501
+
+    assert [model.name for model in LookupModel.objects.filter(age__gt=30, name__startswith="a")] in (["ada", "alan"], ["alan", "ada"])  # noqa: E501
+    assert len(built) == 2
+    assert [model.name for model in LookupModel.objects.filter(age__range=(10, 30))] == ["bob"]
+    assert LookupModel.objects.exists(name__in=("bob", "carl"))
+    assert not LookupModel.objects.exists(age__lt=18)
+
+
+def test_validate_on_load(monkeypatch):
+    class TrustedModel(DbmModel):
+        int: int
+
+        class Config:
+            validate_on_load = False
+
+    model = TrustedModel.objects.create(int=1)
+    monkeypatch.setattr(type(TrustedModel), "__call__", lambda cls, **kwargs: pytest.fail("validators must not run"))
+
+    assert TrustedModel.objects.get(id=model.id) == model
+    assert list(TrustedModel.objects.all()) == [model]
+    assert list(TrustedModel.objects.filter(int=1)) == [model]
+
+
+def test_values():
+    class ValuesModel(DbmModel):
+        name: str
+        age: int
+
+    ada = ValuesModel.objects.create(name="ada", age=36)
+
+    assert list(ValuesModel.objects.values("id", "name")) == [{"id": ada.id, "name": "ada"}]
+    assert list(ValuesModel.objects.values()) == [{"name": "ada", "age": 36, "id": ada.id}]
+    assert list(ValuesModel.objects.values_list("age", "name")) == [(36, "ada")]
+    assert list(ValuesModel.objects.values_list("name", flat=True)) == ["ada"]
+
+    with pytest.raises(ValueError):
+        list(ValuesModel.objects.values_list("name", "age", flat=True))
+    with pytest.raises(UnnecessaryParamsError) as cm:
+        list(ValuesModel.objects.values("surname"))
+    assert str(cm.value) == "surname is not defined in ValuesModel"
+
+
+def test_count_is_maintained(minimum_manager, monkeypatch):
+    minimum_manager.save(id="1", fields={"str": "1"})
+    minimum_manager.save(id="1", fields={"str": "2"})
+    minimum_manager.bulk_create([{"str": "3"}, {"str": "4"}])
+    minimum_manager.delete(id="1")
+
+    with pytest.raises(KeyError):
+        minimum_manager.delete(id="1")
+
+    monkeypatch.setattr(DatabaseManager, "_recount", lambda self, db: pytest.fail("count must not walk the keys"))
+    assert minimum_manager.count() == 2
+    assert len(minimum_manager) == 2
+
+
+def test_recount(minimum_manager):
+    minimum_manager.save(id="1", fields={"str": "1"})
+    with minimum_manager as db:
+        db["__database_count__"] = b"10"
+    assert minimum_manager.count() == 10
+
+    assert minimum_manager.recount() == 1
+    assert minimum_manager.count() == 1
+
+    with minimum_manager as db:
+        del db["__database_count__"]
+    assert minimum_manager.count() == 1
+    assert list(minimum_manager) == ["1"]
+
+
+def test_cache():
+    class CacheModel(DbmModel):
+        int: int
+
+        class Config:
+            cache_size = 10
+
+    model = CacheModel.objects.create(int=1)
+    CacheModel.objects.cache_clear()
+
+    assert CacheModel.objects.get(id=model.id) == model
+    assert CacheModel.objects.get(id=model.id) == model
+    assert CacheModel.objects.get_many([model.id]) == {model.id: model}
+    assert CacheModel.objects.cache_info() == (2, 1, 0, 10, 1)
+
+    CacheModel.objects.update(id=model.id, int=2)
+    assert CacheModel.objects.get(id=model.id).int == 2
+
+    CacheModel.objects.delete(id=model.id)
+    with pytest.raises(CacheModel.DoesNotExists):
+        CacheModel.objects.get(id=model.id)
+
+
+def test_cache_disabled(minimum_manager):
+    assert minimum_manager.cache is None
+    assert minimum_manager.cache_info() == (0, 0, 0, 0, 0)
+
+
+def test_batch(minimum_manager, monkeypatch):
+    minimum_manager.save(id="deleted", fields={"str": "deleted"})
+
+    with minimum_manager.batch() as objects:
+        opened = []
+        monkeypatch.setattr(DatabaseManager, "open", lambda self: opened.append(self) or pytest.fail("must not open"))
+
+        objects.save(id="1", fields={"str": "first"})
+        objects.save(id="1", fields={"str": "second"})
+        objects.save(id="2", fields={"str": "2"})
+        objects.delete(id="2")
+        assert objects.get(id="1").str == "second"
+        assert objects.exists(id="1")
+        assert "2" not in objects
+        with pytest.raises(KeyError):
+            objects.delete(id="2")
+
+        monkeypatch.undo()
+        assert objects.get_many(["1", "2"]) == {"1": minimum_manager.model(str="second")}
+        objects.delete(id="deleted")
+        with pytest.raises(minimum_manager.model.DoesNotExists):
+            objects.get(id="deleted")
+        assert len(objects) == 1
+
+    assert minimum_manager.get(id="1").str == "second"
+    assert "2" not in minimum_manager
+    assert "deleted" not in minimum_manager
+    assert len(minimum_manager) == 1
+
+
+def test_batch_bulk_create(minimum_manager):
+    model = minimum_manager.create(str="a")
+
+    with minimum_manager.batch() as objects:
+        model.delete()
+        ids = objects.bulk_create([model, {"str": "b"}], batch_size=1)
+        assert ids[0] == model.id and len(ids) == 2
+        assert objects.exists(id=model.id)
+        assert list(minimum_manager) == [model.id]  # NOTE: nothing is written before the block exits
+
+        for operation in (objects.recount, objects.rebuild_indexes, lambda: objects.reshard(2)):
+            with pytest.raises(RuntimeError):
+                operation()
+
+    assert minimum_manager.exists(id=model.id)
+    assert minimum_manager.count() == minimum_manager.recount() == 2
+
+
+def test_batch_discarded_on_error(minimum_manager):
+    with pytest.raises(RuntimeError):
+        with minimum_manager.batch() as objects:
+            objects.save(id="1", fields={"str": "1"})
+            raise RuntimeError
+
+    assert "1" not in minimum_manager
+    assert minimum_manager._batch is None
+
+
+def test_nested_batch(minimum_manager):
+    with minimum_manager.batch() as objects:
+        with objects.batch():
+            objects.save(id="1", fields={"str": "1"})
+        assert "1" not in list(objects)
+
+    assert list(minimum_manager) == ["1"]
+
+
+def test_thread_safe():
+    class ThreadSafeModel(DbmModel):
+        int: int
+
+        class Config:
+            thread_safe = True
+
+    objects = ThreadSafeModel.objects
+    assert objects.is_persistent
+    db = objects.open()
+
+    errors: list[BaseException] = []
+
+    def work(start: int) -> None:
+        try:
+            for value in range(start, start + 20):
+                ThreadSafeModel(int=value).save()
+                model = objects.get(int=value)
+                objects.update(id=model.id, int=value)
+                assert sum(1 for _ in objects.all()) >= 1
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(start,)) for start in range(0, 80, 20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert objects.open() is db
+    assert objects.count() == objects.recount() == 80
+    assert sorted(model.int for model in objects.all()) == list(range(80))
+    assert (objects.lock.readers, objects.lock.writer) == (0, None)
+    objects.close()
+
+
+def test_thread_safe_scan_takes_the_keys_at_once():
+    class ThreadSafeScanModel(DbmModel):
+        int: int
+
+        class Config:
+            thread_safe = True
+
+    objects = ThreadSafeScanModel.objects
+    ids = [objects.create(int=value).id for value in range(3)]
+
+    scan = objects.scan()
+    first, _ = next(scan)
+    for id in ids:
+        if id != first:
+            objects.delete(id=id)
+    objects.create(int=3)
+
+    assert list(scan) == []
+    assert (objects.lock.readers, objects.lock.writer) == (0, None)
+    objects.close()
+
+
+def test_scan_lists_the_rest_after_a_write(monkeypatch):
+    class WriteInScanModel(DbmModel):
+        int: int
+
+    def cursor(db):  # NOTE: like the cursor of dbm.gnu, it is lost once the table is written
+        keys = sorted(db.keys())
+        for key in keys:
+            yield key
+            if sorted(db.keys()) != keys:
+                return
+
+    monkeypatch.setattr("pydbm.database.manager.iter_keys", cursor)
+    objects = WriteInScanModel.objects
+    objects.bulk_create({"int": value} for value in range(10))
+
+    seen = []
+    for model in objects.all():
+        seen.append(model.int)
+        if model.int % 2:
+            model.delete()
+    assert sorted(seen) == list(range(10))
+    assert objects.count() == 5
+
+    seen = []
+    for model in objects.all():
+        seen.append(model.int)
+        model.int += 10
+        model.save()
+    assert sorted(seen) == [0, 2, 4, 6, 8]
+    assert sorted(model.int for model in objects.all()) == [10, 12, 14, 16, 18]
+
+
+class ProcessLockModel(DbmModel):
+    int: int
+
+    class Config:
+        process_lock = True
+        lock_timeout = 0.1
+
+
+def _create_process_lock_models(start: int) -> None:
+    for value in range(start, start + 10):
+        ProcessLockModel(int=value).save()
+
+
+def test_process_lock():
+    objects = ProcessLockModel.objects
+    model = objects.create(int=1)
+    assert not objects._DatabaseManager__is_db_open
+
+    for model in objects.all():
+        objects.update(id=model.id, int=2)
+    assert objects.get(id=model.id).int == 2
+    assert objects.file_lock.depth == 0
+
+    other = FileLock(objects.file_lock.path)
+    with other.exclusive():
+        with pytest.raises(LockTimeoutError):
+            objects.get(id=model.id)
+    with other.shared():
+        assert objects.get(id=model.id).int == 2
+        with pytest.raises(LockTimeoutError):
+            objects.delete(id=model.id)
+    other.close()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork is not available")
+def test_process_lock_processes(monkeypatch):
+    monkeypatch.setattr(ProcessLockModel.objects.file_lock, "timeout", 10.0)
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_create_process_lock_models, args=(start,)) for start in range(0, 40, 10)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+    assert ProcessLockModel.objects.count() == ProcessLockModel.objects.recount() == 40
+    assert sorted(model.int for model in ProcessLockModel.objects.all()) == list(range(40))
+
+
+class IndexedProcessLockModel(DbmModel):
+    name: str = Field(index=True)
+    int: int
+
+    class Config:
+        process_lock = True
+
+
+def _read_indexed_process_lock_models() -> None:
+    for _ in range(20):
+        assert len(list(IndexedProcessLockModel.objects.filter(name="even"))) == 5
+        assert IndexedProcessLockModel.objects.exists(name="odd")
+
+
+def test_process_lock_indexed_reads():
+    objects = IndexedProcessLockModel.objects
+    objects.bulk_create({"name": "odd" if value % 2 else "even", "int": value} for value in range(10))
+
+    with objects._reading():
+        assert [model.int % 2 for model in objects.filter(name="odd")] == [1] * 5
+        assert objects.indexes["name"].flag == "r"
+
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_read_indexed_process_lock_models) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+
+    objects.create(name="odd", int=11)
+    assert objects.indexes["name"].flag == "c"
+    assert len(list(objects.filter(name="odd"))) == 6
+
+
+@pytest.mark.parametrize("engine", ["log", "memory"])
+def test_process_lock_engine_not_supported(engine):
+    with pytest.raises(TypeError) as cm:
+        type("ProcessLockEngineModel", (DbmModel,), {
+            "__annotations__": {"int": int},
+            "Config": type("Config", (), {"engine": engine, "process_lock": True}),
+        })
+    assert str(cm.value) == f"Process locks are not supported yet with the {engine} engine!"
+
+
+def test_process_lock_count_without_counter():
+    objects = ProcessLockModel.objects
+    objects.create(int=1), objects.create(int=2)
+    with objects._writing(), objects as db:
+        del db["__database_count__"]
+
+    assert objects.count() == 2
+    assert objects.recount() == 2
+    with objects._reading(), objects as db:
+        assert db["__database_count__"] == b"2"
+
+
+def test_compression():
+    class CompressedModel(DbmModel):
+        str: str
+
+        class Config:
+            compression = "zlib"
+            compression_threshold = 100
+
+    objects = CompressedModel.objects
+    small, big = objects.create(str="small"), objects.create(str="big " * 100)
+
+    with objects as db:
+        assert db[small.id][0] == 1
+        assert db[big.id][0] == 0x81
+    assert objects.get(id=big.id) == big
+    assert sorted(model.str for model in objects.all()) == ["big " * 100, "small"]
+
+    info = objects.compression_info()
+    assert (info.records, info.compressed) == (2, 1)
+    assert info.ratio < 0.5
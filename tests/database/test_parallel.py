@@ -0,0 +1,74 @@
+import pytest
+
+from pydbm import DbmModel, Field
+from pydbm.database.engines import DbmEngine
+from pydbm.database.parallel import filter_partition, parallel_filter
+from pydbm.database.serializers import BinarySerializer
+
+
+class ParallelModel(DbmModel):
+    name: str
+    age: int
+
+
+class IndexedParallelModel(DbmModel):
+    name: str = Field(index=True)
+
+
+class MemoryParallelModel(DbmModel):
+    name: str
+
+    class Config:
+        engine = "memory"
+
+
+@pytest.fixture(scope="function")
+def models():
+    ParallelModel.objects.bulk_create({"name": str(age), "age": age} for age in range(50))
+    return sorted(ParallelModel.objects.all(), key=lambda model: model.age)
+
+
+def test_parallel_filter(models):
+    assert sorted(ParallelModel.objects.filter(age__gte=10, workers=3), key=lambda model: model.age) == models[10:]
+    assert list(ParallelModel.objects.filter(age__gt=100, workers=2)) == []
+
+
+def test_parallel_filter_partition(models):
+    keys = [bytes(model.id, "utf-8") for model in models[:5]] + [b"missing"]
+    matches = filter_partition(
+        DbmEngine,
+        ParallelModel.objects.db_paths,
+        BinarySerializer,
+        ParallelModel.objects.__database_headers__,
+        {"age__lt": 3},
+        keys,
+    )
+
+    assert sorted(matches, key=lambda match: match[1]["age"]) == [(model.id, model.fields) for model in models[:3]]
+
+
+def test_parallel_filter_runs_in_process(monkeypatch):
+    IndexedParallelModel.objects.create(name="ada")
+    MemoryParallelModel.objects.create(name="ada")
+    monkeypatch.setattr("pydbm.database.manager.parallel_filter", None)
+
+    assert [model.name for model in IndexedParallelModel.objects.filter(name="ada", workers=2)] == ["ada"]
+    assert [model.name for model in MemoryParallelModel.objects.filter(name="ada", workers=2)] == ["ada"]
+    assert [model.name for model in IndexedParallelModel.objects.filter(name="ada", workers=1)] == ["ada"]
+
+
+def test_parallel_filter_closes_the_handle(models, monkeypatch):
+    objects = ParallelModel.objects
+    handles = []
+
+    def _parallel_filter(**kwargs):
+        handles.append(objects._DatabaseManager__is_db_open)
+        return parallel_filter(**kwargs)
+
+    monkeypatch.setattr("pydbm.database.manager.parallel_filter", _parallel_filter)
+    with objects.session():
+        assert objects._DatabaseManager__is_db_open is True
+        assert len(list(objects.filter(age__lt=5, workers=2))) == 5
+        assert objects.count() == 50
+
+    assert handles == [False]
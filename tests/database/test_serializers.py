@@ -0,0 +1,136 @@
+import datetime
+
+import pytest
+
+from pydbm.database.compression import BaseCompressor, CompressionInfo
+from pydbm.database.serializers import BaseSerializer, BinarySerializer, ReprSerializer
+
+HEADERS = {
+    "bool": bool,
+    "bytes": bytes,
+    "date": datetime.date,
+    "datetime": datetime.datetime,
+    "float": float,
+    "int": int,
+    "none": None,
+    "str": str,
+    "id": str,
+}
+FIELDS = {
+    "bool": True,
+    "bytes": b"\x00test",
+    "date": datetime.date(2021, 1, 1),
+    "datetime": datetime.datetime(2021, 1, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    "float": -1.5,
+    "int": -(2**70),
+    "none": None,
+    "str": "tést",
+}
+
+
+@pytest.mark.parametrize("name", ["binary", "json", "marshal", "pickle", "repr"])
+def test_encode_decode(name):
+    serializer = BaseSerializer.get_serializer(name)(HEADERS)
+    data = serializer.encode(FIELDS)
+
+    assert data[0] == serializer.format_version
+    assert serializer.decode(data) == FIELDS
+
+
+@pytest.mark.parametrize("name", ["binary", "json", "marshal", "pickle", "repr"])
+def test_decode_written_by_another_serializer(name):
+    data = BaseSerializer.get_serializer(name)(HEADERS).encode(FIELDS)
+    assert BinarySerializer(HEADERS, readable=(name,)).decode(data) == FIELDS
+
+
+@pytest.mark.parametrize("name", ["json", "marshal", "pickle"])
+def test_decode_not_readable(name, monkeypatch):
+    data = BaseSerializer.get_serializer(name)(HEADERS).encode(FIELDS)
+    monkeypatch.setattr("pickle.loads", lambda data: pytest.fail("pickle must not be loaded"))
+
+    with pytest.raises(ValueError) as cm:
+        BinarySerializer(HEADERS).decode(data)
+    assert str(cm.value).startswith(f"Records of the {name} serializer are not readable by this table")
+
+
+def test_binary_has_no_field_names():
+    assert b"str" not in BinarySerializer(HEADERS).encode(FIELDS)
+
+
+def test_get_serializer_error():
+    with pytest.raises(TypeError) as cm:
+        BaseSerializer.get_serializer("unknown")
+    assert str(cm.value) == "Serializer unknown is not supported yet!"
+
+
+@pytest.mark.parametrize("value", [0, 1, -1, 127, 128, -128, -129, 2**64])
+def test_int_round_trip(value):
+    serializer = BinarySerializer({"int": int, "id": str})
+    assert serializer.decode(serializer.encode({"int": value})) == {"int": value}
+
+
+def test_missing_field():
+    serializer = BinarySerializer(HEADERS)
+    assert serializer.decode(serializer.encode({"str": "test"})) == {"str": "test"}
+
+
+def test_decode_legacy():
+    serializer = BinarySerializer(HEADERS)
+    assert ReprSerializer.format_version == ord("{")
+    data = b"{'bool': 'True', 'bytes': 'test', 'date': '2021-01-01', 'float': '1.0', 'int': '1', 'none': 'None', 'str': 'test'}"  # noqa: E501
+
+    assert serializer.decode(data) == {
+        "bool": True,
+        "bytes": b"test",
+        "date": datetime.date(2021, 1, 1),
+        "float": 1.0,
+        "int": 1,
+        "none": None,
+        "str": "test",
+    }
+
+
+def test_decode_unknown_version():
+    with pytest.raises(ValueError) as cm:
+        BinarySerializer(HEADERS).decode(b"\xfftest")
+    assert str(cm.value) == "Unknown record format version: 255"
+
+
+@pytest.mark.parametrize("name", ["binary", "json", "marshal", "pickle", "repr"])
+def test_decode_field_names(name):
+    serializer = BaseSerializer.get_serializer(name)(HEADERS)
+    data = serializer.encode(FIELDS)
+
+    assert serializer.decode(data, {"int", "date", "missing"}) == {"int": FIELDS["int"], "date": FIELDS["date"]}
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma", "bz2"])
+def test_compression(compression):
+    threshold = len(BinarySerializer(HEADERS).encode(FIELDS)) + 1
+    serializer = BinarySerializer(HEADERS, compression=compression, compression_threshold=threshold)
+    small = serializer.encode(FIELDS)
+    big = serializer.encode({**FIELDS, "str": "pydbm " * 100})
+
+    assert small[0] == BinarySerializer.format_version
+    assert big[0] == BaseCompressor.get_compressor(compression).flag
+    assert serializer.decode(big) == {**FIELDS, "str": "pydbm " * 100}
+    assert BinarySerializer(HEADERS).decode(memoryview(big), {"str"}) == {"str": "pydbm " * 100}
+
+    info = serializer.compression_info()
+    assert (info.records, info.compressed) == (2, 1)
+    assert info.raw_size == len(small) + len(serializer.dumps({**FIELDS, "str": "pydbm " * 100}))
+    assert info.stored_size == len(small) + len(big)
+    assert info.ratio < 1
+
+
+def test_compression_keeps_incompressible_records():
+    serializer = BinarySerializer({"bytes": bytes}, compression="zlib", compression_threshold=0)
+    data = serializer.encode({"bytes": bytes(range(256))})
+
+    assert data[0] == BinarySerializer.format_version
+    assert serializer.compression_info() == CompressionInfo(records=1, compressed=0, raw_size=len(data), stored_size=len(data))  # noqa: E501
+
+
+def test_get_compressor_error():
+    with pytest.raises(TypeError, match="Compression brotli is not supported yet!"):
+        BinarySerializer(HEADERS, compression="brotli")
@@ -0,0 +1,80 @@
+import pytest
+
+from pydbm import DbmModel
+from pydbm.database.engines import MemoryDatabase
+from pydbm.database.shards import ShardedDatabase, shard_of
+
+
+class ShardedModel(DbmModel):
+    name: str
+    age: int
+
+    class Config:
+        shards = 4
+
+
+def test_shard_of():
+    assert shard_of("key", 4) == shard_of(b"key", 4)
+    assert {shard_of(str(i), 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+def test_sharded_database():
+    shards = [{}, {}, {}]
+    db = ShardedDatabase([MemoryDatabase(shard) for shard in shards], broadcast=("header",))
+    db["header"] = b"h"
+    for i in range(10):
+        db[str(i)] = bytes(str(i), "utf-8")
+
+    assert [shard[b"header"] for shard in shards] == [b"h", b"h", b"h"]
+    assert all(shards[shard_of(str(i), 3)][bytes(str(i), "utf-8")] for i in range(10))
+    assert sorted(db.keys()) == sorted([b"header"] + [bytes(str(i), "utf-8") for i in range(10)])
+    assert len(db) == 11
+    assert "1" in db and "missing" not in db
+
+    del db["1"]
+    del db["header"]
+    assert "1" not in db
+    assert all(b"header" not in shard for shard in shards)
+
+
+def test_sharded_model():
+    objects = ShardedModel.objects
+    assert objects.db_paths == tuple(f"pydbm/shardedmodels.shard{shard}of4.pydbm" for shard in range(4))
+
+    models = [objects.create(name=str(age), age=age) for age in range(20)]
+    objects.delete(id=models[0].id)
+    objects.update(id=models[1].id, age=100)
+
+    assert objects.count() == objects.recount() == 19
+    assert objects.get(id=models[2].id) == models[2]
+    assert sorted(model.age for model in objects.all()) == list(range(2, 20)) + [100]
+    assert sorted(model.age for model in objects.filter(age__gte=18, workers=2)) == [18, 19, 100]
+
+    with objects as db:
+        assert sum(int(shard[b"__database_count__"]) for shard in db.shards) == 19
+        assert all(int(shard[b"__database_count__"]) for shard in db.shards)
+
+
+def test_reshard():
+    class UnshardedModel(DbmModel):
+        name: str
+
+        class Config:
+            table_name = "reshardmodels"
+
+    models = [UnshardedModel.objects.create(name=str(i)) for i in range(10)]
+
+    class ReshardedModel(DbmModel):
+        name: str
+
+        class Config:
+            table_name = "reshardmodels"
+            shards = 3
+
+    assert ReshardedModel.objects.count() == 0
+    assert ReshardedModel.objects.reshard(1) == 10
+    assert ReshardedModel.objects.reshard(3) == 10
+    assert sorted(model.name for model in ReshardedModel.objects.all()) == sorted(model.name for model in models)
+
+    with pytest.raises(ValueError):
+        ReshardedModel.objects.reshard(0)
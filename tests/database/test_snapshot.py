@@ -0,0 +1,84 @@
+import datetime
+
+import pytest
+
+from pydbm import DbmModel, Field
+from pydbm.database import SnapshotManager
+
+
+class SnapshotModel(DbmModel):
+    name: str
+    age: int
+    born: datetime.date = Field(default=datetime.date(2000, 1, 1))
+
+    class Config:
+        unique_together = ("name",)
+
+
+class JsonSnapshotModel(DbmModel):
+    name: str
+
+    class Config:
+        serializer = "json"
+
+
+@pytest.fixture(scope="function")
+def snapshot_path(tmp_path):
+    return tmp_path / "snapshot.pydbm.snap"
+
+
+def test_export_snapshot(snapshot_path):
+    models = [SnapshotModel.objects.create(name=name, age=age) for name, age in (("ada", 36), ("alan", 41), ("grace", 85))]  # noqa: E501
+
+    assert SnapshotModel.objects.export_snapshot(snapshot_path) == 3
+    SnapshotModel.objects.delete(id=models[0].id)
+
+    with SnapshotManager(model=SnapshotModel, path=snapshot_path) as snapshot:
+        assert len(snapshot) == snapshot.count() == 3
+        assert list(snapshot) == sorted(model.id for model in models)
+        assert models[0].id in snapshot
+        assert "missing" not in snapshot
+
+        for model in models:
+            assert snapshot.get(id=model.id) == model
+            assert snapshot[model.id] == model
+        assert snapshot.get(name="alan") == models[1]
+        with pytest.raises(SnapshotModel.DoesNotExists):
+            snapshot.get(id="missing")
+
+        assert sorted(snapshot.all(), key=lambda model: model.name) == models
+        assert sorted(snapshot.filter(age__gt=40), key=lambda model: model.name) == models[1:]
+        assert list(snapshot.filter(id=models[2].id, age=85)) == [models[2]]
+        assert list(snapshot.filter(id="missing")) == []
+        assert snapshot.exists(name="grace") is True
+        assert snapshot.exists(name="bob") is False
+
+
+def test_export_snapshot_converts_records(snapshot_path):
+    model = JsonSnapshotModel.objects.create(name="ada")
+
+    JsonSnapshotModel.objects.export_snapshot(snapshot_path)
+    with SnapshotManager(model=JsonSnapshotModel, path=snapshot_path) as snapshot:
+        [(id, record)] = snapshot.scan()
+        assert isinstance(record, memoryview)
+        assert record[0] == 1
+        assert snapshot.get(id=id) == model
+        del record  # NOTE: the mapping can not be closed while a record view is alive
+
+
+def test_export_empty_snapshot(snapshot_path):
+    assert SnapshotModel.objects.export_snapshot(snapshot_path) == 0
+    with SnapshotManager(model=SnapshotModel, path=snapshot_path) as snapshot:
+        assert len(snapshot) == 0
+        assert list(snapshot.all()) == []
+        assert "missing" not in snapshot
+
+
+def test_snapshot_invalid_file(snapshot_path):
+    snapshot_path.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError, match="is not a pydbm snapshot"):
+        SnapshotManager(model=SnapshotModel, path=snapshot_path)
+
+    JsonSnapshotModel.objects.export_snapshot(snapshot_path)
+    with pytest.raises(ValueError, match="Snapshot headers are not equal"):
+        SnapshotManager(model=SnapshotModel, path=snapshot_path)
@@ -0,0 +1,79 @@
+import pytest
+
+from pydbm import DbmModel
+from pydbm.database import disable_stats, enable_stats, stats_enabled
+from pydbm.database.stats import StatsCollector
+
+
+class StatsModel(DbmModel):
+    name: str
+    age: int
+
+    class Config:
+        cache_size = 10
+
+
+@pytest.fixture(scope="function")
+def stats():
+    enable_stats()
+    StatsModel.objects.stats_clear()
+    yield
+    disable_stats()
+
+
+def test_switch():
+    assert stats_enabled() is False
+    enable_stats()
+    assert stats_enabled() is True is StatsCollector.enabled
+    disable_stats()
+    assert stats_enabled() is False
+
+
+def test_collector():
+    collector = StatsCollector()
+    collector.record("read", 0.5, 10)
+    collector.record("write", 0.25, 20)
+    collector.record("write", 0.25, 5)
+
+    def records():
+        yield 1
+        yield 2
+
+    assert list(collector.timed_scan(records())) == [1, 2]
+    assert collector.counts["scan"] == 1
+
+    collector.clear()
+    assert collector.counts["write"] == 0 and collector.bytes_written == 0
+
+
+def test_stats(stats):
+    objects = StatsModel.objects
+    model = objects.create(name="ada", age=36)
+    objects.cache_clear()
+    objects.get(id=model.id)
+    objects.get(id=model.id)
+    assert [model.name for model in objects.all()] == ["ada"]
+    objects.delete(id=model.id)
+
+    info = objects.stats()
+    assert (info.writes, info.deletes, info.scans, info.encodes) == (1, 1, 1, 1)
+    assert info.reads == 2  # NOTE: the second get is a cache hit
+    assert info.decodes == 2 and info.builds == 3
+    assert info.opens == info.closes == 4
+    assert info.bytes_written > 0 and info.bytes_read == 2 * info.bytes_written
+    assert info.write_time > 0 and info.read_time > 0 and info.scan_time > 0 and info.build_time > 0
+    assert (info.cache.hits, info.compression.records) == (1, 0)
+
+    objects.stats_clear()
+    assert objects.stats().writes == 0
+
+
+def test_stats_disabled():
+    objects = StatsModel.objects
+    objects.stats_clear()
+    objects.create(name="ada", age=36)
+    assert list(objects.all())
+
+    info = objects.stats()
+    assert info.opens == info.writes == info.reads == info.scans == info.encodes == info.builds == 0
+    assert info.open_time == info.scan_time == 0.0
@@ -356,3 +356,23 @@ def test_base_exists_false_more_fields():
             unique_together = ("username",)
 
     assert Model.objects.exists(name="hakan", surname="celik") is False
+
+
+def test_base_from_db():
+    fields = {
+        "bool": True,
+        "bytes": b"123",
+        "date": datetime.date(2020, 1, 1),
+        "datetime": datetime.datetime(2020, 1, 1, 2, 10, 40),
+        "float": 1.0,
+        "int": 1,
+        "none": None,
+        "str": "str",
+    }
+    model = Model.from_db("552eb2e66df095304137be35af85aaed", fields)
+
+    assert model == Model(**fields)
+    assert model.fields == fields
+    assert model.id == "552eb2e66df095304137be35af85aaed"
+
+    assert Model.from_db("id", {**fields, "int": "not validated"}).int == "not validated"